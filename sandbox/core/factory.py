@@ -124,6 +124,7 @@ def create_sandbox(
             workspace_root = Path(workspace_root)
 
     # Auto-generate session_id if not provided
+    session_is_new = session_id is None
     if session_id is None:
         session_id = str(uuid.uuid4())
 
@@ -171,8 +172,9 @@ def create_sandbox(
                         policy.guest_data_path = "/data_js"
                         break
 
-    # Create session via storage adapter
-    if not storage_adapter.session_exists(session_id):
+    # Create session via storage adapter. A freshly generated UUID cannot name
+    # an existing workspace, so it skips the existence probe.
+    if session_is_new or not storage_adapter.session_exists(session_id):
         storage_adapter.create_session(session_id)
 
         # Log session creation
@@ -7,6 +7,7 @@ imports, and generating actionable recommendations for fuel budget adjustments.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any
 
 # Package fuel requirements (first import, in billions of instructions)
@@ -26,6 +27,20 @@ PACKAGE_FUEL_REQUIREMENTS = {
 }
 
 
+@lru_cache(maxsize=64)
+def _package_import_pattern(package: str) -> re.Pattern[str]:
+    """Compile the import/mention patterns for one package into one regex.
+
+    Cached per package name, so repeated analyses skip re-formatting and
+    re-compiling (or re-looking-up) the same three patterns.
+    """
+    name = re.escape(package)
+    return re.compile(
+        rf"\bimport\s+{name}\b|\bfrom\s+{name}\b|\b{name}\b.*imported",
+        re.IGNORECASE,
+    )
+
+
 def detect_heavy_packages(stderr: str) -> list[str]:
     """Detect heavy package imports from stderr output.
 
@@ -46,16 +61,8 @@ def detect_heavy_packages(stderr: str) -> list[str]:
             continue
 
         # Check for various import patterns
-        patterns = [
-            rf"\bimport\s+{re.escape(package)}\b",
-            rf"\bfrom\s+{re.escape(package)}\b",
-            rf"\b{re.escape(package)}\b.*imported",
-        ]
-
-        for pattern in patterns:
-            if re.search(pattern, stderr, re.IGNORECASE):
-                detected.append(package)
-                break
+        if _package_import_pattern(package).search(stderr):
+            detected.append(package)
 
     return detected
 
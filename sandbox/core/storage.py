@@ -7,17 +7,82 @@ and API compatibility.
 
 from __future__ import annotations
 
-import json
+import fnmatch
+import os
 import shutil
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
     from sandbox.sessions import SessionMetadata
 
+# Parsed .metadata.json contents keyed by (path, st_mtime_ns, st_size) so
+# repeated pruning scans stat() unchanged files instead of re-parsing them.
+# A rewritten file produces a new key, so no explicit invalidation is needed.
+_METADATA_CACHE: OrderedDict[tuple[str, int, int], dict[str, Any]] = OrderedDict()
+_METADATA_CACHE_MAX_ENTRIES = 512
+_METADATA_CACHE_LOCK = threading.Lock()
+# Files modified more recently than this may be rewritten again within the
+# filesystem's timestamp granularity without changing (mtime, size), so they
+# are never cached.
+_METADATA_CACHE_MIN_AGE_NS = 2_000_000_000
+
+
+def _iter_workspace_files(workspace: Path) -> Iterator[tuple[str, os.DirEntry[str]]]:
+    """Yield (relative POSIX path, DirEntry) for every file under workspace.
+
+    os.scandir yields DirEntry objects whose type is known from the directory
+    listing, and each entry caches its stat() result, so a file costs at most
+    one stat call. Like Path.rglob, symlinked directories are not descended
+    into.
+    """
+    pending = [(str(workspace), "")]
+    while pending:
+        directory, prefix = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                relative = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((entry.path, relative + "/"))
+                elif entry.is_file():
+                    yield relative, entry
+
+
+def _parent_segments_match(relative: str, dir_segments: list[str]) -> bool:
+    """Return whether the directories just above a file match dir_segments.
+
+    relative is a POSIX path from _iter_workspace_files; the last
+    len(dir_segments) parent directories are matched one glob each, the way
+    Path.rglob() anchors a pattern's directory part.
+    """
+    if not dir_segments:
+        return True
+    parents = relative.split("/")[:-1]
+    if len(parents) < len(dir_segments):
+        return False
+    tail = parents[len(parents) - len(dir_segments) :]
+    return all(fnmatch.fnmatch(part, glob) for part, glob in zip(tail, dir_segments, strict=True))
+
+
+def link_or_copy(src: str, dst: str) -> None:
+    """Hardlink src to dst, falling back to a copy where links are refused.
+
+    Usable as a shutil.copytree copy_function. Cross-device targets (EXDEV)
+    and filesystems without hardlink support (EPERM/ENOTSUP) raise OSError
+    from os.link().
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
 
 class StorageBackend(str, Enum):
     """Supported storage backend types for workspace management.
@@ -363,14 +428,18 @@ class DiskStorageAdapter(StorageAdapter):
                 f"Invalid path '{relative_path}': must be relative to session workspace"
             )
 
-        # Resolve and validate path is within session workspace
-        full_path = (workspace / relative_path).resolve()
-        workspace_resolved = workspace.resolve()
+        # Resolve and validate path is within session workspace. realpath() on
+        # plain strings plus a separator-terminated prefix check does the same
+        # as resolve() + is_relative_to() without building intermediate Paths.
+        full_real = os.path.realpath(os.path.join(workspace, relative_path))
+        workspace_real = os.path.realpath(workspace)
+        full_key = os.path.normcase(full_real)
+        workspace_key = os.path.normcase(workspace_real)
 
-        if not full_path.is_relative_to(workspace_resolved):
+        if full_key != workspace_key and not full_key.startswith(os.path.join(workspace_key, "")):
             raise ValueError(f"Path '{relative_path}' escapes session workspace")
 
-        return (workspace, full_path)
+        return (workspace, Path(full_real))
 
     def create_session(self, session_id: str) -> None:
         """Create session workspace directory with metadata.
@@ -463,6 +532,23 @@ class DiskStorageAdapter(StorageAdapter):
         if not workspace.exists():
             return []
 
+        # rglob() matches a pattern against the trailing segments of paths at
+        # any depth (a leading "**/" adds nothing). Split into directory
+        # segments and a name part, the scandir walker rejects most files on
+        # their name alone, without building a Path or stat()ing each
+        # candidate. Patterns with "**" further in keep the rglob() path.
+        segments = pattern.split("/")
+        while len(segments) > 1 and segments[0] == "**":
+            segments.pop(0)
+        if not any(segment in ("", ".", "..", "**") for segment in segments):
+            *dir_segments, name_pattern = segments
+            return sorted(
+                relative
+                for relative, entry in _iter_workspace_files(workspace)
+                if fnmatch.fnmatch(entry.name, name_pattern)
+                and _parent_segments_match(relative, dir_segments)
+            )
+
         files = []
         for file in workspace.rglob(pattern):
             if file.is_file():
@@ -523,10 +609,9 @@ class DiskStorageAdapter(StorageAdapter):
         if not self.workspace_root.exists():
             return []
 
-        sessions = []
-        for item in self.workspace_root.iterdir():
-            if item.is_dir():
-                sessions.append(item.name)
+        # scandir() reuses the d_type from readdir, avoiding a stat() per entry
+        with os.scandir(self.workspace_root) as entries:
+            sessions = [entry.name for entry in entries if entry.is_dir()]
 
         return sorted(sessions)
 
@@ -543,14 +628,29 @@ class DiskStorageAdapter(StorageAdapter):
             FileNotFoundError: If metadata file doesn't exist
             json.JSONDecodeError: If metadata is corrupted
         """
-        from sandbox.sessions import SessionMetadata
+        from sandbox.sessions import SessionMetadata, _load_metadata
 
         _, metadata_path = self._validate_session_path(session_id, self.METADATA_FILENAME)
 
-        if not metadata_path.exists():
-            raise FileNotFoundError(f"Metadata not found for session '{session_id}'")
+        # stat() doubles as the existence probe, so legacy sessions without
+        # metadata cost a single failed syscall during pruning scans
+        try:
+            st = metadata_path.stat()
+            key = (str(metadata_path), st.st_mtime_ns, st.st_size)
+            with _METADATA_CACHE_LOCK:
+                data = _METADATA_CACHE.get(key)
+                if data is not None:
+                    _METADATA_CACHE.move_to_end(key)
+            if data is None:
+                data = _load_metadata(metadata_path.read_bytes())
+                if time.time_ns() - st.st_mtime_ns >= _METADATA_CACHE_MIN_AGE_NS:
+                    with _METADATA_CACHE_LOCK:
+                        _METADATA_CACHE[key] = data
+                        if len(_METADATA_CACHE) > _METADATA_CACHE_MAX_ENTRIES:
+                            _METADATA_CACHE.popitem(last=False)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Metadata not found for session '{session_id}'") from None
 
-        data = json.loads(metadata_path.read_text())
         return SessionMetadata.from_dict(data)
 
     def write_metadata(self, session_id: str, metadata: SessionMetadata) -> None:
@@ -560,9 +660,11 @@ class DiskStorageAdapter(StorageAdapter):
             session_id: UUIDv4 session identifier
             metadata: SessionMetadata to persist
         """
+        from sandbox.sessions import _dump_metadata
+
         _, metadata_path = self._validate_session_path(session_id, self.METADATA_FILENAME)
 
-        metadata_path.write_text(json.dumps(metadata.to_dict(), indent=2))
+        metadata_path.write_text(_dump_metadata(metadata.to_dict()), encoding="utf-8")
 
     def update_session_timestamp(self, session_id: str) -> None:
         """Update session's updated_at timestamp.
@@ -570,21 +672,32 @@ class DiskStorageAdapter(StorageAdapter):
         Args:
             session_id: UUIDv4 session identifier
         """
+        from sandbox.sessions import _dump_metadata, _load_metadata
+
         _, metadata_path = self._validate_session_path(session_id, self.METADATA_FILENAME)
 
         if not metadata_path.exists():
             return
 
-        data = json.loads(metadata_path.read_text())
+        data = _load_metadata(metadata_path.read_text(encoding="utf-8"))
         data["updated_at"] = datetime.now(UTC).isoformat()
-        metadata_path.write_text(json.dumps(data, indent=2))
-
-    def copy_vendor_packages(self, session_id: str, vendor_path: Path) -> None:
+        metadata_path.write_text(_dump_metadata(data), encoding="utf-8")
+
+    def copy_vendor_packages(
+        self,
+        session_id: str,
+        vendor_path: Path,
+        link_mode: Literal["copy", "hardlink"] = "copy",
+    ) -> None:
         """Copy vendored site-packages to session workspace.
 
         Args:
             session_id: UUIDv4 session identifier
             vendor_path: Host path to vendor directory
+            link_mode: "hardlink" links each file to the vendor original (one
+                link() per file instead of a data copy), falling back to a
+                copy where the filesystem refuses. The guest can write to
+                linked files, which modifies vendor/; trusted workloads only.
 
         Raises:
             FileNotFoundError: If vendor/site-packages doesn't exist
@@ -600,7 +713,10 @@ class DiskStorageAdapter(StorageAdapter):
         if dst.exists():
             shutil.rmtree(dst)
 
-        shutil.copytree(src, dst)
+        if link_mode == "hardlink":
+            shutil.copytree(src, dst, copy_function=link_or_copy)
+        else:
+            shutil.copytree(src, dst)
 
     def get_workspace_snapshot(self, session_id: str) -> dict[str, float]:
         """Get snapshot of all files with modification times.
@@ -617,11 +733,8 @@ class DiskStorageAdapter(StorageAdapter):
         if not workspace.exists():
             return snapshot
 
-        for file in workspace.rglob("*"):
-            if file.is_file():
-                relative = file.relative_to(workspace)
-                # Convert to POSIX path (forward slashes) for consistency across platforms
-                snapshot[relative.as_posix()] = file.stat().st_mtime
+        for relative, entry in _iter_workspace_files(workspace):
+            snapshot[relative] = entry.stat().st_mtime
 
         return snapshot
 
@@ -640,8 +753,7 @@ class DiskStorageAdapter(StorageAdapter):
         if not workspace.exists():
             return 0
 
-        for file in workspace.rglob("*"):
-            if file.is_file():
-                total += file.stat().st_size
+        for _, entry in _iter_workspace_files(workspace):
+            total += entry.stat().st_size
 
         return total
@@ -14,6 +14,7 @@ code must be isolated from the host system.
 from __future__ import annotations
 
 import contextlib
+import functools
 import os
 import shutil
 import stat
@@ -78,6 +79,60 @@ class SandboxResult:
         self.stderr_truncated = stderr_truncated
 
 
+# Path to a Wasmtime cache TOML. When set, compiled modules are also persisted
+# on disk and reused by later processes instead of being recompiled.
+WASMTIME_CACHE_CONFIG_ENV = "LLM_WASM_SANDBOX_WASMTIME_CACHE"
+
+
+@functools.lru_cache(maxsize=8)
+def _load_runtime(
+    wasm_path: str,
+    mtime_ns: int | None,
+    size: int | None,
+    cache_config: str | None = None,
+) -> tuple[Engine, Linker, Module]:
+    """Compile a WASM binary once per process and reuse it across executions.
+
+    Compiling the CPython binary dominates per-execution cost, while the
+    Engine, Linker and Module are immutable and safe to share between Stores.
+    The cache key includes the file's mtime and size so a replaced binary is
+    recompiled. All per-execution state (WASI config, fuel, memory limits)
+    lives on the Store, so sharing these objects does not weaken isolation.
+
+    If cache_config names a Wasmtime cache configuration file, Wasmtime's
+    on-disk code cache is enabled so the compilation also survives across
+    processes.
+    """
+    cfg = Config()
+    cfg.consume_fuel = True
+    if cache_config:
+        cfg.cache = cache_config
+    engine = Engine(cfg)
+
+    linker = Linker(engine)
+    linker.define_wasi()
+
+    module = Module.from_file(engine, wasm_path)
+    return engine, linker, module
+
+
+def _get_runtime(wasm_path: str) -> tuple[Engine, Linker, Module]:
+    """Return the cached (Engine, Linker, Module) for wasm_path.
+
+    Honours the LLM_WASM_SANDBOX_WASMTIME_CACHE environment variable, which
+    points at a Wasmtime cache TOML enabling the on-disk compilation cache.
+    """
+    abs_path = os.path.abspath(wasm_path)
+    try:
+        st = os.stat(abs_path)
+        mtime_ns: int | None = st.st_mtime_ns
+        size: int | None = st.st_size
+    except OSError:
+        mtime_ns = size = None
+    cache_config = os.environ.get(WASMTIME_CACHE_CONFIG_ENV) or None
+    return _load_runtime(abs_path, mtime_ns, size, cache_config)
+
+
 def run_untrusted_python(
     wasm_path: str = "bin/python.wasm",
     workspace_dir: str | None = None,
@@ -116,14 +171,7 @@ def run_untrusted_python(
     preserve_logs = bool(getattr(policy, "preserve_logs", False))
     cleanup_paths: list[str] = []
 
-    cfg = Config()
-    cfg.consume_fuel = True
-    engine = Engine(cfg)
-
-    linker = Linker(engine)
-    linker.define_wasi()
-
-    module = Module.from_file(engine, wasm_path)
+    engine, linker, module = _get_runtime(wasm_path)
 
     tmp = tempfile.mkdtemp(prefix="wasm-python-")
     out_log = os.path.join(tmp, "stdout.log")
@@ -372,14 +420,7 @@ def run_untrusted_javascript(
     preserve_logs = bool(getattr(policy, "preserve_logs", False))
     cleanup_paths: list[str] = []
 
-    cfg = Config()
-    cfg.consume_fuel = True
-    engine = Engine(cfg)
-
-    linker = Linker(engine)
-    linker.define_wasi()
-
-    module = Module.from_file(engine, wasm_path)
+    engine, linker, module = _get_runtime(wasm_path)
 
     tmp = tempfile.mkdtemp(prefix="wasm-javascript-")
     out_log = os.path.join(tmp, "stdout.log")
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import os
 import tomllib
+from typing import Any
 
 from pydantic import ValidationError
 
@@ -75,6 +76,21 @@ def load_policy(path: str = "config/policy.toml") -> ExecutionPolicy:
     with open(path, "rb") as f:
         data = tomllib.load(f)
 
+    return _policy_from_dict(data)
+
+
+def _policy_from_dict(data: dict[str, Any]) -> ExecutionPolicy:
+    """Merge parsed policy settings with DEFAULT_POLICY and validate them.
+
+    Args:
+        data: Policy settings as parsed from a policy TOML file.
+
+    Returns:
+        ExecutionPolicy: Validated policy model with merged configuration.
+
+    Raises:
+        PolicyValidationError: If the merged policy contains invalid values
+    """
     # Merge top-level keys, with user overrides taking precedence
     policy = DEFAULT_POLICY | data
 
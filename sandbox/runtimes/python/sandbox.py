@@ -7,7 +7,9 @@ and Pydantic-based result models (SandboxResult).
 
 from __future__ import annotations
 
+import re
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -27,6 +29,71 @@ if '/data/site-packages' not in sys.path:
 """
 
 
+# Vendored packages (matches what's in vendor/site-packages) and the
+# ModuleNotFoundError line naming the missing one, built once at import
+# instead of on every failed execution
+_VENDORED_PACKAGES = frozenset(
+    {
+        "openpyxl",
+        "xlsxwriter",
+        "pypdf2",
+        "pdfminer",
+        "odfpy",
+        "mammoth",
+        "tabulate",
+        "jinja2",
+        "markupsafe",
+        "markdown",
+        "dateutil",
+        "attr",
+        "attrs",
+        "certifi",
+        "charset_normalizer",
+        "idna",
+        "urllib3",
+        "six",
+        "tomli",
+    }
+)
+_NO_MODULE_RE = re.compile(r"No module named '([^']+)'")
+
+
+# Only sources up to this many characters are memoized, so the cache holds
+# at most maxsize * _SYNTAX_CACHE_MAX_CHARS characters (about 1 MB) of
+# untrusted code alive for the life of the process.
+_SYNTAX_CACHE_MAX_CHARS = 4096
+
+
+def _compiles(code: str) -> bool:
+    """Return whether code compiles."""
+    try:
+        # Not ast.parse(): errors such as 'return' outside function or a
+        # misplaced nonlocal are only raised by the compiler's symtable pass.
+        # dont_inherit keeps this module's __future__ flags out of the check;
+        # optimize=2 skips assert/docstring code generation, which cannot
+        # affect whether the source parses
+        compile(code, "<sandbox>", "exec", dont_inherit=True, optimize=2)
+        return True
+    except SyntaxError:
+        return False
+
+
+_compiles_cached = lru_cache(maxsize=256)(_compiles)
+
+
+def _check_syntax(code: str) -> bool:
+    """Return whether code compiles, memoizing small sources.
+
+    Syntax validity depends only on the source text, so agents that
+    re-validate the same snippet before executing it are served from the
+    cache instead of recompiling. Sources longer than
+    _SYNTAX_CACHE_MAX_CHARS are compiled every time rather than retained.
+    """
+    if len(code) > _SYNTAX_CACHE_MAX_CHARS:
+        return _compiles(code)
+    return _compiles_cached(code)
+
+
 class PythonSandbox(BaseSandbox):
     """Type-safe Python sandbox implementation using CPython WASM runtime.
 
@@ -68,6 +135,7 @@ class PythonSandbox(BaseSandbox):
         super().__init__(policy, session_id, storage_adapter, logger)
         self.wasm_binary_path = wasm_binary_path
         self.auto_persist_globals = auto_persist_globals
+        self._session_ready = False
 
     def execute(self, code: str, inject_setup: bool = True, **kwargs: Any) -> SandboxResult:
         """Execute untrusted Python code in WASM sandbox with resource limits and session tracking.
@@ -108,6 +176,9 @@ class PythonSandbox(BaseSandbox):
 
             code = wrap_stateful_code(code)
 
+        # Create the session workspace on first use
+        self._ensure_session()
+
         # Write code to workspace
         user_code_path = self._write_untrusted_code(code, inject_setup)
 
@@ -168,7 +239,7 @@ class PythonSandbox(BaseSandbox):
 
         Uses Python's compile() builtin to parse code and check for syntax
         errors. Does not execute the code or import any modules, making this
-        safe for untrusted input.
+        safe for untrusted input. Results are cached per source string.
 
         Args:
             code: Python source code to validate
@@ -176,11 +247,7 @@ class PythonSandbox(BaseSandbox):
         Returns:
             True if syntax is valid, False if syntax errors exist
         """
-        try:
-            compile(code, "<sandbox>", "exec")
-            return True
-        except SyntaxError:
-            return False
+        return _check_syntax(code)
 
     def _write_untrusted_code(self, code: str, inject_setup: bool) -> str:
         """Write untrusted Python code to workspace via storage adapter.
@@ -379,41 +446,16 @@ class PythonSandbox(BaseSandbox):
         if not stderr or "ModuleNotFoundError" not in stderr:
             return stderr
 
-        # List of vendored packages (matches what's in vendor/site-packages)
-        vendored_packages = {
-            "openpyxl",
-            "xlsxwriter",
-            "pypdf2",
-            "pdfminer",
-            "odfpy",
-            "mammoth",
-            "tabulate",
-            "jinja2",
-            "markupsafe",
-            "markdown",
-            "dateutil",
-            "attr",
-            "attrs",
-            "certifi",
-            "charset_normalizer",
-            "idna",
-            "urllib3",
-            "six",
-            "tomli",
-        }
-
         # Extract module name from error message
         # Pattern: "ModuleNotFoundError: No module named 'package_name'"
-        import re
-
-        match = re.search(r"No module named '([^']+)'", stderr)
+        match = _NO_MODULE_RE.search(stderr)
         if not match:
             return stderr
 
         module_name = match.group(1).split(".")[0].lower()  # Get base package name
 
         # Check if this is a vendored package
-        if module_name not in vendored_packages:
+        if module_name not in _VENDORED_PACKAGES:
             return stderr
 
         # Check if user tried the wrong path
@@ -442,6 +484,18 @@ class PythonSandbox(BaseSandbox):
 
         return stderr + hint
 
+    def _ensure_session(self) -> None:
+        """Create the session workspace and metadata if they don't exist yet.
+
+        Deferred from __init__ so sandboxes that only validate code never touch
+        storage. Checked once per instance; later executions skip the lookup.
+        """
+        if self._session_ready:
+            return
+        if not self.storage_adapter.session_exists(self.session_id):
+            self.storage_adapter.create_session(self.session_id)
+        self._session_ready = True
+
     def _update_session_timestamp(self) -> None:
         """Update the updated_at timestamp in session metadata after execution.
 
@@ -127,16 +127,46 @@ from __future__ import annotations
 import json
 import os
 import uuid
-from dataclasses import asdict, dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    _orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from sandbox.core.logging import SandboxLogger
     from sandbox.core.storage import StorageAdapter
 
 
+def _dump_metadata(data: dict[str, Any]) -> str:
+    """Serialize session metadata to indented JSON, using orjson when installed.
+
+    orjson writes non-ASCII characters as raw UTF-8 where json.dumps emits
+    \\uXXXX escapes, so callers must write the result with encoding="utf-8".
+    """
+    if _orjson is not None:
+        return _orjson.dumps(data, option=_orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
+def _load_metadata(raw: str | bytes) -> Any:
+    """Parse session metadata JSON, using orjson when installed.
+
+    Raises:
+        json.JSONDecodeError: If raw is not valid JSON (orjson's error type
+            subclasses it)
+    """
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+
 @dataclass
 class SessionMetadata:
     """Metadata for session workspace tracking creation and update timestamps.
@@ -193,7 +223,14 @@ class SessionMetadata:
             >>> print(data['session_id'])
             abc-123
         """
-        return asdict(self)
+        # Built directly rather than via dataclasses.asdict(), which deep-copies
+        # and walks fields reflectively; all fields here are immutable scalars
+        return {
+            "session_id": self.session_id,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "version": self.version,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> SessionMetadata:
@@ -351,7 +388,7 @@ def _read_session_metadata(session_id: str, workspace_root: Path) -> SessionMeta
         return None
 
     try:
-        data = json.loads(metadata_path.read_text())
+        data = _load_metadata(metadata_path.read_text(encoding="utf-8"))
         return SessionMetadata.from_dict(data)
     except (json.JSONDecodeError, KeyError, TypeError) as e:
         # Log warning but don't fail - corrupted metadata shouldn't break operations
@@ -399,9 +436,9 @@ def _update_session_timestamp(
         return
 
     try:
-        data = json.loads(metadata_path.read_text())
+        data = _load_metadata(metadata_path.read_text(encoding="utf-8"))
         data["updated_at"] = datetime.now(UTC).isoformat()
-        metadata_path.write_text(json.dumps(data, indent=2))
+        metadata_path.write_text(_dump_metadata(data), encoding="utf-8")
 
         # Log structured event if logger provided
         if logger is not None:
@@ -652,6 +689,20 @@ def _enumerate_sessions(workspace_root: Path) -> list[str]:
     return sessions
 
 
+@lru_cache(maxsize=8192)
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO 8601 metadata timestamp, memoized by string.
+
+    Pruning scans re-read the same updated_at values on every call, so
+    repeated parses of an unchanged timestamp are served from the cache.
+    A rewritten timestamp is a new string and therefore a new cache key.
+
+    Raises:
+        ValueError: If timestamp is not valid ISO 8601
+    """
+    return datetime.fromisoformat(timestamp)
+
+
 def _calculate_session_age(metadata: SessionMetadata) -> float:
     """Calculate session age in hours from updated_at timestamp.
 
@@ -680,7 +731,7 @@ def _calculate_session_age(metadata: SessionMetadata) -> float:
         True
     """
     # Parse updated_at timestamp (ISO 8601 format)
-    updated_at = datetime.fromisoformat(metadata.updated_at.replace("Z", "+00:00"))
+    updated_at = _parse_iso(metadata.updated_at.replace("Z", "+00:00"))
 
     # Calculate elapsed time
     now = datetime.now(UTC)
@@ -1100,8 +1151,9 @@ def prune_sessions(
     reclaimed_bytes = 0
     errors = {}
 
-    # Calculate cutoff timestamp
-    cutoff = datetime.now(UTC) - timedelta(hours=older_than_hours)
+    # Calculate cutoff timestamp once; ages are reported relative to the same instant
+    now = datetime.now(UTC)
+    cutoff = now - timedelta(hours=older_than_hours)
 
     # Log start of pruning
     if logger is not None:
@@ -1112,18 +1164,38 @@ def prune_sessions(
         )
 
     # Enumerate all sessions
-    for session_id in storage_adapter.enumerate_sessions():
+    session_ids = storage_adapter.enumerate_sessions()
+    read_metadata = storage_adapter.read_metadata
+
+    def _load(session_id: str) -> SessionMetadata | Exception:
+        try:
+            return read_metadata(session_id)
+        except Exception as e:
+            return e
+
+    # Metadata reads are I/O-bound, so overlap them to hide disk/NFS latency.
+    # Deletion and logging below stay sequential and in enumeration order.
+    if len(session_ids) > 1:
+        with ThreadPoolExecutor(max_workers=min(32, len(session_ids))) as executor:
+            loaded = list(executor.map(_load, session_ids))
+    else:
+        loaded = [_load(session_id) for session_id in session_ids]
+
+    for session_id, metadata_or_error in zip(session_ids, loaded, strict=True):
         try:
-            # Read metadata to check age
-            metadata = storage_adapter.read_metadata(session_id)
-            updated_at = datetime.fromisoformat(metadata.updated_at)
+            # Re-raise read failures so they are classified below
+            if isinstance(metadata_or_error, Exception):
+                raise metadata_or_error
+            metadata = metadata_or_error
+            updated_at = _parse_iso(metadata.updated_at)
 
             if updated_at < cutoff:
                 # Session is old enough to prune
+                age_hours = (now - updated_at).total_seconds() / 3600
                 if logger is not None:
                     logger.log_prune_candidate(
                         session_id=session_id,
-                        age_hours=(datetime.now(UTC) - updated_at).total_seconds() / 3600,
+                        age_hours=age_hours,
                         threshold_hours=older_than_hours,
                     )
 
@@ -1133,7 +1205,6 @@ def prune_sessions(
                     reclaimed_bytes += session_size
 
                     if logger is not None:
-                        age_hours = (datetime.now(UTC) - updated_at).total_seconds() / 3600
                         logger.log_prune_deleted(
                             session_id=session_id,
                             age_hours=age_hours,
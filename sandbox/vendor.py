@@ -20,6 +20,9 @@ import shutil
 import subprocess
 import sys
 from pathlib import Path
+from typing import Literal
+
+from sandbox.core.storage import link_or_copy
 
 
 def setup_vendor_dir(vendor_dir: str | Path = "vendor") -> Path:
@@ -120,7 +123,9 @@ def install_pure_python_package(
 
 
 def copy_vendor_to_workspace(
-    vendor_dir: str | Path = "vendor", workspace_dir: str | Path = "workspace"
+    vendor_dir: str | Path = "vendor",
+    workspace_dir: str | Path = "workspace",
+    link_mode: Literal["copy", "hardlink"] = "copy",
 ) -> None:
     """Copy vendored packages into workspace for WASM guest access.
 
@@ -133,6 +138,11 @@ def copy_vendor_to_workspace(
     Args:
         vendor_dir: Source vendor root directory (default: "vendor")
         workspace_dir: Target workspace directory (default: "workspace")
+        link_mode: "copy" (default) copies file contents. "hardlink" links each
+            file to the vendor original instead, falling back to a copy per
+            file where the filesystem refuses. Hardlinked files share their
+            data with vendor/, so a guest that writes to /app/site-packages
+            modifies the vendor tree; only use it for trusted workloads.
     """
     vendor_path = Path(vendor_dir)
     workspace_path = Path(workspace_dir)
@@ -147,7 +157,8 @@ def copy_vendor_to_workspace(
     if dst.exists():
         shutil.rmtree(dst)
 
-    shutil.copytree(src, dst)
+    copy_function = link_or_copy if link_mode == "hardlink" else shutil.copy2
+    shutil.copytree(src, dst, copy_function=copy_function)
     print(f"✓ Copied vendored packages from {src} to {dst}")
 
 
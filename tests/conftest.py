@@ -2,11 +2,224 @@
 
 from __future__ import annotations
 
+import io
+import json
+import os
+import shutil
+import uuid
 from pathlib import Path
 
 import pytest
+import structlog
 
+from sandbox.core.logging import SandboxLogger
 from sandbox.core.models import ExecutionPolicy
+from sandbox.host import WASMTIME_CACHE_CONFIG_ENV
+
+WASMTIME_CACHE_TEMPLATE = Path(__file__).parent / "wasmtime-cache.toml"
+TEST_TMPDIR_ENV = "SANDBOX_TEST_TMPDIR"
+TEST_FAST_ENGINE_ENV = "SANDBOX_TEST_FAST_ENGINE"
+
+
+def _configure_temproot():
+    """Optionally move pytest's temporary directories to another root.
+
+    Every workspace fixture lives under tmp_path_factory's basetemp, so
+    pointing SANDBOX_TEST_TMPDIR at a tmpfs such as /dev/shm turns the guest's
+    WASI file operations into memory operations. Unset or empty keeps the
+    system temp dir. An explicit PYTEST_DEBUG_TEMPROOT or --basetemp still
+    wins.
+    """
+    if "PYTEST_DEBUG_TEMPROOT" in os.environ:
+        return
+    root = os.environ.get(TEST_TMPDIR_ENV)
+    if root:
+        os.environ["PYTEST_DEBUG_TEMPROOT"] = root
+
+
+def pytest_configure(config):
+    """Set up the temp root before any tmp_path_factory is created."""
+    _configure_temproot()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _wasmtime_cache(request, tmp_path_factory):
+    """Enable Wasmtime's on-disk compilation cache for this test session.
+
+    Wasmtime requires an absolute cache directory, so the committed template
+    is rendered into pytest's cache (d/wasmtime under .pytest_cache), which
+    persists between runs and is shared by xdist workers. With the cache
+    plugin disabled it falls back to a per-session temp dir. The first run
+    compiles python.wasm as usual; later runs load the cached machine code
+    instead of recompiling it. The config variable is only set for the
+    session, and an explicitly exported LLM_WASM_SANDBOX_WASMTIME_CACHE is
+    left untouched.
+    """
+    if os.environ.get(WASMTIME_CACHE_CONFIG_ENV):
+        yield None
+        return
+    cache = getattr(request.config, "cache", None)
+    if cache is not None:
+        cache_dir = cache.mkdir("wasmtime")
+    else:
+        cache_dir = tmp_path_factory.mktemp("wasmtime-cache")
+    rendered = cache_dir / "config.toml"
+    template = WASMTIME_CACHE_TEMPLATE.read_text(encoding="utf-8")
+    # Render then rename so concurrent xdist workers never read a partial file
+    staging = cache_dir / f"config.{os.getpid()}.toml"
+    staging.write_text(
+        template.replace("{cache_dir}", (cache_dir / "modules").as_posix()),
+        encoding="utf-8",
+    )
+    os.replace(staging, rendered)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(WASMTIME_CACHE_CONFIG_ENV, str(rendered))
+        yield rendered
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_engine():
+    """Compile runtimes without Wasmtime's SIMD proposals when opted in.
+
+    Set SANDBOX_TEST_FAST_ENGINE=1 to enable. Neither bundled guest uses
+    SIMD, so this only trims code generation. Reference types stay enabled
+    because quickjs.wasm fails validation without them. Only the test
+    session's sandbox.host.Config is patched, and runtimes compiled before or
+    after it are dropped from the per-process cache.
+    """
+    if os.environ.get(TEST_FAST_ENGINE_ENV) != "1":
+        yield
+        return
+
+    import wasmtime
+
+    from sandbox import host as host_module
+
+    def simd_free_config() -> wasmtime.Config:
+        cfg = wasmtime.Config()
+        cfg.wasm_simd = False
+        cfg.wasm_relaxed_simd = False
+        return cfg
+
+    host_module._load_runtime.cache_clear()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(host_module, "Config", simd_free_config)
+        yield
+    host_module._load_runtime.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def _tmp_root(tmp_path_factory):
+    """Session-wide parent directory for per-test workspaces.
+
+    Created under pytest's per-worker basetemp, so it is also safe under
+    pytest-xdist, and removed with a single rmtree when the session ends.
+    """
+    root = tmp_path_factory.mktemp("sandbox-suite-")
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def workspace_root(tmp_path_factory):
+    """Worker-local workspace root for sandboxes shared across tests.
+
+    Lives under the worker's basetemp and is named after PYTEST_XDIST_WORKER
+    (``gw0`` outside xdist), so parallel workers never create sessions under
+    the same root the way they would under the default ./workspace. pytest
+    rotates it out with the rest of basetemp.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    root = tmp_path_factory.getbasetemp() / f"ws-{worker}"
+    root.mkdir(exist_ok=True)
+    return root
+
+
+@pytest.fixture
+def temp_workspace(_tmp_root):
+    """Create temporary workspace directory for test isolation.
+
+    Each test gets a fresh subdirectory of the session root; nothing is torn
+    down per test, so cleanup cost is paid once per session.
+    """
+    workspace = _tmp_root / uuid.uuid4().hex
+    workspace.mkdir()
+    return workspace
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip wasm-marked tests up front when bin/python.wasm is not built.
+
+    One stat() replaces a FileNotFoundError per test on checkouts without the
+    binary. Tests that exercise the missing-binary path are not wasm-marked
+    and still run.
+    """
+    if Path("bin/python.wasm").exists():
+        return
+    skip_wasm = pytest.mark.skip(reason="bin/python.wasm not built")
+    for item in items:
+        if "wasm" in item.keywords:
+            item.add_marker(skip_wasm)
+
+
+@pytest.fixture(scope="session")
+def wasm_runtime(_wasmtime_cache, _fast_engine):
+    """Compile bin/python.wasm once per test process.
+
+    sandbox.host caches the Engine/Linker/Module per binary, so every
+    PythonSandbox executed afterwards reuses this compilation and each test
+    only pays for its own session workspace and guest execution. Under
+    pytest-xdist (``pytest -n auto``) every worker is its own process and
+    session, so each worker compiles once and then runs its share of tests
+    independently. Classes that execute code request it via usefixtures so
+    the one-off compile is charged to fixture setup rather than to whichever
+    test happens to run first.
+    """
+    from sandbox.host import _get_runtime
+
+    if not Path("bin/python.wasm").exists():
+        return None
+    return _get_runtime("bin/python.wasm")
+
+
+@pytest.fixture(scope="session")
+def log_sink():
+    """In-memory sink shared by every capture_logger in the test session."""
+    return io.StringIO()
+
+
+@pytest.fixture
+def capture_logger(log_sink):
+    """Create a SandboxLogger whose JSON events land in log_sink.
+
+    Wraps a logger directly instead of calling structlog.configure() per test,
+    which re-registered global processors on every call and leaked the test
+    configuration into other modules. log_sink is emptied for each test.
+    """
+    log_sink.seek(0)
+    log_sink.truncate()
+
+    logger = structlog.wrap_logger(
+        structlog.PrintLogger(log_sink),
+        processors=[
+            structlog.processors.add_log_level,
+            structlog.processors.JSONRenderer(),
+        ],
+        wrapper_class=structlog.BoundLogger,
+        context_class=dict,
+        cache_logger_on_first_use=True,
+    )
+    return SandboxLogger(logger)
+
+
+@pytest.fixture
+def logged_events(log_sink):
+    """Return a callable listing the event names capture_logger has written, in order."""
+
+    def events():
+        return [json.loads(line)["event"] for line in log_sink.getvalue().splitlines()]
+
+    return events
 
 
 @pytest.fixture
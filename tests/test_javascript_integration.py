@@ -10,8 +10,7 @@ This module tests full workflows combining multiple features:
 
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
+import uuid
 
 import pytest
 
@@ -22,15 +21,6 @@ from sandbox.runtimes.javascript import JavaScriptSandbox
 from sandbox.runtimes.python import PythonSandbox
 
 
-@pytest.fixture
-def temp_workspace():
-    """Create temporary workspace directory for test isolation."""
-    with tempfile.TemporaryDirectory(
-        prefix="test-workspace-", ignore_cleanup_errors=True
-    ) as tmpdir:
-        yield Path(tmpdir)
-
-
 @pytest.fixture
 def policy_with_vendor(policy_with_vendor_js):
     """Create ExecutionPolicy with vendor_js mount configured."""
@@ -42,8 +32,6 @@ class TestJavaScriptFullWorkflow:
 
     def test_full_workflow_with_state_and_packages(self, temp_workspace, policy_with_vendor):
         """Test full workflow combining state persistence and vendored packages."""
-        import uuid
-
         session_id = str(uuid.uuid4())
 
         # Create sandbox with state persistence and vendored packages
@@ -133,8 +121,6 @@ console.log('Execution 3 - Slug:', _state.lastSlug);
         self, temp_workspace, policy_with_vendor, policy_with_vendor_python
     ):
         """Test workflow when code injection is disabled."""
-        import uuid
-
         session_id = str(uuid.uuid4())
 
         sandbox = JavaScriptSandbox(
@@ -165,8 +151,6 @@ class TestCrossRuntimeConsistency:
         self, temp_workspace, policy_with_vendor, policy_with_vendor_python
     ):
         """Compare state persistence behavior across Python and JavaScript."""
-        import uuid
-
         # Python session
         python_session_id = str(uuid.uuid4())
         python_workspace = temp_workspace / "python"
@@ -228,8 +212,6 @@ console.log('JavaScript counter:', _state.counter);
         self, temp_workspace, policy_with_vendor, policy_with_vendor_python
     ):
         """Compare helper utility behavior across runtimes."""
-        import uuid
-
         # Python session
         python_session_id = str(uuid.uuid4())
         python_workspace = temp_workspace / "python"
@@ -290,8 +272,6 @@ console.log('JavaScript count:', data.count);
         self, temp_workspace, policy_with_vendor, policy_with_vendor_python
     ):
         """Verify both runtimes have equivalent vendored packages."""
-        import uuid
-
         # Python session
         python_session_id = str(uuid.uuid4())
         python_workspace = temp_workspace / "python"
@@ -353,8 +333,6 @@ class TestErrorScenarios:
         self, temp_workspace, policy_with_vendor, policy_with_vendor_python
     ):
         """Test that fuel exhaustion preserves state up to failure point."""
-        import uuid
-
         session_id = str(uuid.uuid4())
 
         sandbox = JavaScriptSandbox(
@@ -389,8 +367,6 @@ while (true) {
         self, temp_workspace, policy_with_vendor, policy_with_vendor_python
     ):
         """Test error handling when vendored package is missing."""
-        import uuid
-
         session_id = str(uuid.uuid4())
 
         sandbox = JavaScriptSandbox(
@@ -419,8 +395,6 @@ try {
         self, temp_workspace, policy_with_vendor, policy_with_vendor_python
     ):
         """Test that corrupted state file is handled gracefully."""
-        import uuid
-
         session_id = str(uuid.uuid4())
 
         sandbox = JavaScriptSandbox(
@@ -450,8 +424,6 @@ console.log('State keys:', Object.keys(_state).join(', '));
         self, temp_workspace, policy_with_vendor, policy_with_vendor_python
     ):
         """Test error handling in helper utilities."""
-        import uuid
-
         session_id = str(uuid.uuid4())
 
         sandbox = JavaScriptSandbox(
@@ -550,8 +522,6 @@ class TestSessionIsolation:
         self, temp_workspace, policy_with_vendor, policy_with_vendor_python
     ):
         """Test that different sessions have isolated state."""
-        import uuid
-
         # Session 1
         session1_id = str(uuid.uuid4())
         workspace1 = temp_workspace / "session1"
@@ -608,8 +578,6 @@ class TestSessionIsolation:
         self, temp_workspace, policy_with_vendor, policy_with_vendor_python
     ):
         """Test that different sessions have isolated workspaces."""
-        import uuid
-
         # Session 1
         session1_id = str(uuid.uuid4())
         workspace1 = temp_workspace / "session1"
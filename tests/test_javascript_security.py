@@ -12,32 +12,18 @@ This module tests security boundaries for the JavaScript runtime:
 
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
-
-import pytest
+import uuid
 
 from sandbox.core.models import ExecutionPolicy, SandboxResult
 from sandbox.core.storage import DiskStorageAdapter
 from sandbox.runtimes.javascript import JavaScriptSandbox
 
 
-@pytest.fixture
-def temp_workspace():
-    """Create temporary workspace directory for test isolation."""
-    with tempfile.TemporaryDirectory(
-        prefix="test-workspace-", ignore_cleanup_errors=True
-    ) as tmpdir:
-        yield Path(tmpdir)
-
-
 class TestJavaScriptFuelExhaustion:
     """Test fuel metering and exhaustion on infinite loops."""
 
     def test_fuel_exhaustion_on_infinite_loop(self, temp_workspace):
         """Test that infinite loops trigger fuel exhaustion."""
-        import uuid
-
         # Use very low fuel budget to trigger exhaustion quickly
         policy = ExecutionPolicy(fuel_budget=100_000)
         session_id = str(uuid.uuid4())
@@ -67,8 +53,6 @@ while (true) {
 
     def test_fuel_exhaustion_on_tight_computation(self, temp_workspace):
         """Test that tight computational loops hit fuel limits."""
-        import uuid
-
         policy = ExecutionPolicy(fuel_budget=500_000)
         session_id = str(uuid.uuid4())
 
@@ -94,8 +78,6 @@ for (let i = 0; i < 10000000; i++) {
 
     def test_normal_code_within_fuel_budget(self, temp_workspace):
         """Test that normal code completes within default fuel budget."""
-        import uuid
-
         policy = ExecutionPolicy()  # Default budget
         session_id = str(uuid.uuid4())
 
@@ -123,8 +105,6 @@ class TestJavaScriptMemoryLimits:
 
     def test_memory_limit_configured(self, temp_workspace):
         """Test that memory limits are configured in sandbox."""
-        import uuid
-
         # Use small memory limit
         policy = ExecutionPolicy(memory_bytes=10_000_000)  # 10 MB
         session_id = str(uuid.uuid4())
@@ -154,8 +134,6 @@ try {
 
     def test_memory_metrics_captured(self, temp_workspace):
         """Test that memory usage metrics are captured."""
-        import uuid
-
         policy = ExecutionPolicy()
         session_id = str(uuid.uuid4())
 
@@ -178,8 +156,6 @@ class TestJavaScriptOutputCapping:
 
     def test_stdout_capping_enforced(self, temp_workspace):
         """Test that stdout output is capped at configured limit."""
-        import uuid
-
         policy = ExecutionPolicy(stdout_max_bytes=100)
         session_id = str(uuid.uuid4())
 
@@ -203,8 +179,6 @@ for (let i = 0; i < 100; i++) {
 
     def test_stderr_capping_enforced(self, temp_workspace):
         """Test that stderr output is capped at configured limit."""
-        import uuid
-
         policy = ExecutionPolicy(stderr_max_bytes=100)
         session_id = str(uuid.uuid4())
 
@@ -233,8 +207,6 @@ const e = 'missing quote
 
     def test_output_within_limits_not_truncated(self, temp_workspace):
         """Test that output within limits is not truncated."""
-        import uuid
-
         policy = ExecutionPolicy(stdout_max_bytes=1000, stderr_max_bytes=1000)
         session_id = str(uuid.uuid4())
 
@@ -261,8 +233,6 @@ class TestJavaScriptEnvironmentVariableIsolation:
 
     def test_custom_env_vars_accessible(self, temp_workspace):
         """Test that whitelisted environment variables are accessible."""
-        import uuid
-
         policy = ExecutionPolicy(env={"CUSTOM_VAR": "test_value", "DEBUG": "1"})
         session_id = str(uuid.uuid4())
 
@@ -287,7 +257,6 @@ console.log('Env configured');
     def test_host_env_vars_not_leaked(self, temp_workspace):
         """Test that host environment variables are not leaked to guest."""
         import os
-        import uuid
 
         # Set host-only env var
         original_val = os.environ.get("HOST_SECRET_VAR")
@@ -327,8 +296,6 @@ class TestJavaScriptNoNetworkAccess:
 
     def test_no_network_capabilities(self, temp_workspace):
         """Test that network operations are not available."""
-        import uuid
-
         policy = ExecutionPolicy()
         session_id = str(uuid.uuid4())
 
@@ -357,8 +324,6 @@ class TestJavaScriptSecurityMetadata:
 
     def test_trap_reason_captured_on_fuel_exhaustion(self, temp_workspace):
         """Test that trap_reason is captured when fuel is exhausted."""
-        import uuid
-
         policy = ExecutionPolicy(fuel_budget=100_000)
         session_id = str(uuid.uuid4())
 
@@ -377,8 +342,6 @@ class TestJavaScriptSecurityMetadata:
 
     def test_fuel_consumed_captured(self, temp_workspace):
         """Test that fuel consumption is captured in results."""
-        import uuid
-
         policy = ExecutionPolicy()
         session_id = str(uuid.uuid4())
 
@@ -397,8 +360,6 @@ class TestJavaScriptSecurityMetadata:
 
     def test_policy_snapshot_in_metadata(self, temp_workspace):
         """Test that policy limits are captured in metadata."""
-        import uuid
-
         policy = ExecutionPolicy(fuel_budget=1_000_000_000, memory_bytes=64 * 1024 * 1024)
         session_id = str(uuid.uuid4())
 
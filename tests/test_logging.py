@@ -28,6 +28,18 @@ class StructlogCapture:
         return event_dict
 
 
+@pytest.fixture(autouse=True)
+def _reset_structlog() -> Any:
+    """Restore structlog's global defaults after each test.
+
+    The configure_structlog() tests change process-global configuration;
+    resetting keeps it from leaking into whichever tests an xdist worker
+    (or a serial run) executes next.
+    """
+    yield
+    structlog.reset_defaults()
+
+
 @pytest.fixture
 def log_capture() -> StructlogCapture:
     """Fixture providing structlog event capture."""
@@ -36,9 +48,14 @@ def log_capture() -> StructlogCapture:
 
 @pytest.fixture
 def custom_logger(log_capture: StructlogCapture) -> Any:
-    """Fixture providing a structlog logger with capture processor."""
-    # Configure structlog with capture processor
-    structlog.configure(
+    """Fixture providing a structlog logger with capture processor.
+
+    Wraps a logger directly rather than calling structlog.configure(), so the
+    capture chain is local to this logger and the global configuration is
+    left alone.
+    """
+    return structlog.wrap_logger(
+        structlog.PrintLogger(),
         processors=[
             structlog.processors.add_log_level,
             log_capture,
@@ -46,12 +63,9 @@ def custom_logger(log_capture: StructlogCapture) -> Any:
         ],
         wrapper_class=structlog.BoundLogger,
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
-        cache_logger_on_first_use=False,
+        cache_logger_on_first_use=True,
     )
 
-    return structlog.get_logger("test_sandbox")
-
 
 @pytest.fixture
 def std_logger() -> logging.Logger:
@@ -2,6 +2,7 @@ import json
 import time
 import uuid
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 
 import pytest
 
@@ -10,7 +11,32 @@ from sandbox import (
     create_sandbox,
     prune_sessions,
 )
-from sandbox.sessions import SessionMetadata
+
+# Every test owns a tmp_path workspace. prune_sessions() does fill the
+# module-level metadata and timestamp caches in sandbox.core.storage and
+# sandbox.sessions, but those are per-process and keyed by file identity or
+# timestamp string, so the module can still be distributed across pytest-xdist
+# workers.
+pytestmark = pytest.mark.io_bound
+
+
+def _read_meta(path):
+    """Read a session's .metadata.json in a single read."""
+    return json.loads(path.read_bytes())
+
+
+def _write_meta(path, data):
+    """Write a session's .metadata.json in a single write."""
+    path.write_text(json.dumps(data))
+
+
+def _backdate_meta(path, hours):
+    """Rewrite a session's created_at/updated_at to `hours` in the past."""
+    metadata = _read_meta(path)
+    old_time = (datetime.now(UTC) - timedelta(hours=hours)).isoformat()
+    metadata["updated_at"] = old_time
+    metadata["created_at"] = old_time
+    _write_meta(path, metadata)
 
 
 class TestPruningE2E:
@@ -23,6 +49,33 @@ class TestPruningE2E:
         ws.mkdir()
         return ws
 
+    @pytest.fixture
+    def fake_workspace_root(self, request):
+        """Workspace root on an in-memory pyfakefs filesystem.
+
+        Used by tests that only exercise prune_sessions() and never start a
+        WASM guest, so no real disk I/O is needed.
+        """
+        pytest.importorskip("pyfakefs")
+        fs = request.getfixturevalue("fs")
+        return Path(fs.create_dir("/workspace").path)
+
+    @pytest.fixture
+    def write_meta(self):
+        """Return a helper that creates a session dir with metadata `hours_ago` old."""
+
+        def _write(workspace_root, session_id, hours_ago):
+            session_dir = workspace_root / session_id
+            session_dir.mkdir()
+            stamp = (datetime.now(UTC) - timedelta(hours=hours_ago)).isoformat()
+            _write_meta(
+                session_dir / ".metadata.json",
+                {"session_id": session_id, "created_at": stamp, "updated_at": stamp, "version": 1},
+            )
+            return session_dir
+
+        return _write
+
     def test_e2e_workflow(self, workspace_root):
         """
         Test the complete lifecycle:
@@ -43,12 +96,11 @@ class TestPruningE2E:
         assert metadata_file.exists()
 
         # Verify initial metadata
-        with open(metadata_file) as f:
-            data = json.load(f)
-            created_at = datetime.fromisoformat(data["created_at"])
-            updated_at = datetime.fromisoformat(data["updated_at"])
-            assert data["session_id"] == session_id
-            assert created_at == updated_at
+        data = _read_meta(metadata_file)
+        created_at = datetime.fromisoformat(data["created_at"])
+        updated_at = datetime.fromisoformat(data["updated_at"])
+        assert data["session_id"] == session_id
+        assert created_at == updated_at
 
         # 2. Execute code and verify timestamp update
         # Sleep briefly to ensure timestamp difference is measurable if FS resolution is low
@@ -56,11 +108,10 @@ class TestPruningE2E:
 
         sandbox.execute("print('hello')")
 
-        with open(metadata_file) as f:
-            data = json.load(f)
-            new_updated_at = datetime.fromisoformat(data["updated_at"])
-            assert new_updated_at > updated_at
-            assert data["created_at"] == created_at.isoformat()
+        data = _read_meta(metadata_file)
+        new_updated_at = datetime.fromisoformat(data["updated_at"])
+        assert new_updated_at > updated_at
+        assert data["created_at"] == created_at.isoformat()
 
         # 3. Prune recent sessions (should not delete)
         # Set threshold to 1 hour, session is seconds old
@@ -71,18 +122,8 @@ class TestPruningE2E:
         assert result.reclaimed_bytes == 0
 
         # 4. Prune old sessions (make session appear old by modifying metadata)
-        # Manually update the metadata to have old timestamps
-        metadata_file = session_dir / ".metadata.json"
-        with open(metadata_file) as f:
-            metadata = json.load(f)
-
         # Set timestamps to 2 hours in the past
-        old_time = (datetime.now(UTC) - timedelta(hours=2)).isoformat()
-        metadata["updated_at"] = old_time
-        metadata["created_at"] = old_time
-
-        with open(metadata_file, "w") as f:
-            json.dump(metadata, f)
+        _backdate_meta(metadata_file, hours=2)
 
         result = prune_sessions(older_than_hours=1.0, workspace_root=workspace_root, dry_run=False)
 
@@ -124,18 +165,8 @@ class TestPruningE2E:
         assert (legacy_dir / ".metadata.json").exists()
 
         # 3. Prune should delete the session (make it appear old)
-        # Manually update metadata to have old timestamps
-        metadata_file = legacy_dir / ".metadata.json"
-        with open(metadata_file) as f:
-            metadata = json.load(f)
-
         # Set timestamps to 25 hours in the past
-        old_time = (datetime.now(UTC) - timedelta(hours=25)).isoformat()
-        metadata["updated_at"] = old_time
-        metadata["created_at"] = old_time
-
-        with open(metadata_file, "w") as f:
-            json.dump(metadata, f)
+        _backdate_meta(legacy_dir / ".metadata.json", hours=25)
 
         result = prune_sessions(older_than_hours=24.0, workspace_root=workspace_root, dry_run=False)
 
@@ -144,45 +175,25 @@ class TestPruningE2E:
         assert legacy_id not in result.skipped_sessions
         assert not legacy_dir.exists()  # Should be deleted
 
-    def test_prune_mixed_sessions(self, workspace_root):
+    def test_prune_mixed_sessions(self, fake_workspace_root, write_meta):
         """Test pruning with a mix of valid, old, and legacy sessions."""
         # 1. Old valid session (should be deleted)
         old_id = str(uuid.uuid4())
-        old_dir = workspace_root / old_id
-        old_dir.mkdir()
-
-        old_time = datetime.now(UTC) - timedelta(hours=5)
-        old_meta = SessionMetadata(
-            session_id=old_id,
-            created_at=old_time.isoformat(),
-            updated_at=old_time.isoformat(),
-            version=1,
-        )
-        with open(old_dir / ".metadata.json", "w") as f:
-            json.dump(old_meta.to_dict(), f)
+        old_dir = write_meta(fake_workspace_root, old_id, hours_ago=5)
 
         # 2. New valid session (should be kept)
         new_id = str(uuid.uuid4())
-        new_dir = workspace_root / new_id
-        new_dir.mkdir()
-
-        new_time = datetime.now(UTC)
-        new_meta = SessionMetadata(
-            session_id=new_id,
-            created_at=new_time.isoformat(),
-            updated_at=new_time.isoformat(),
-            version=1,
-        )
-        with open(new_dir / ".metadata.json", "w") as f:
-            json.dump(new_meta.to_dict(), f)
+        new_dir = write_meta(fake_workspace_root, new_id, hours_ago=0)
 
         # 3. Legacy session (should be skipped)
         legacy_id = str(uuid.uuid4())
-        legacy_dir = workspace_root / legacy_id
+        legacy_dir = fake_workspace_root / legacy_id
         legacy_dir.mkdir()
 
         # Prune sessions older than 2 hours
-        result = prune_sessions(older_than_hours=2.0, workspace_root=workspace_root, dry_run=False)
+        result = prune_sessions(
+            older_than_hours=2.0, workspace_root=fake_workspace_root, dry_run=False
+        )
 
         assert old_id in result.deleted_sessions
         assert not old_dir.exists()
@@ -193,22 +204,14 @@ class TestPruningE2E:
         assert legacy_id in result.skipped_sessions
         assert legacy_dir.exists()
 
-    def test_prune_non_uuid_session_ids(self, workspace_root):
+    def test_prune_non_uuid_session_ids(self, fake_workspace_root, write_meta):
         """Pruning should include custom (non-UUID) session IDs."""
         session_id = "custom-session-id"
-        session_dir = workspace_root / session_id
-        session_dir.mkdir()
-
-        stale_time = datetime.now(UTC) - timedelta(hours=2)
-        meta = SessionMetadata(
-            session_id=session_id,
-            created_at=stale_time.isoformat(),
-            updated_at=stale_time.isoformat(),
-            version=1,
-        )
-        (session_dir / ".metadata.json").write_text(json.dumps(meta.to_dict()))
+        session_dir = write_meta(fake_workspace_root, session_id, hours_ago=2)
 
-        result = prune_sessions(older_than_hours=0, workspace_root=workspace_root, dry_run=False)
+        result = prune_sessions(
+            older_than_hours=0, workspace_root=fake_workspace_root, dry_run=False
+        )
 
         assert session_id in result.deleted_sessions
         assert not session_dir.exists()
@@ -7,71 +7,64 @@ and integrates with structured logging.
 
 from __future__ import annotations
 
+import builtins
+import os
+import re
 import shutil
 import tempfile
+import uuid
 from pathlib import Path
 
 import pytest
 
-from sandbox.core.logging import SandboxLogger
+from sandbox import RuntimeType, create_sandbox
+from sandbox import host as sandbox_host
 from sandbox.core.models import ExecutionPolicy, SandboxResult
 from sandbox.core.storage import DiskStorageAdapter
 from sandbox.runtimes.python import PythonSandbox
+from sandbox.runtimes.python import sandbox as python_sandbox_module
+from sandbox.runtimes.python.sandbox import _SYNTAX_CACHE_MAX_CHARS, _compiles_cached
+from sandbox.state import STATE_FILENAME
 
 
-@pytest.fixture
-def temp_workspace():
-    """Create temporary workspace directory for test isolation."""
-    with tempfile.TemporaryDirectory(
-        prefix="test-workspace-", ignore_cleanup_errors=True
-    ) as tmpdir:
-        yield Path(tmpdir)
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_policy():
-    """Create default ExecutionPolicy for tests."""
+    """Create default ExecutionPolicy for tests.
+
+    Shared across the session because PythonSandbox never mutates its policy;
+    tests that need different limits construct their own ExecutionPolicy.
+    """
     return ExecutionPolicy()
 
 
 @pytest.fixture
 def python_sandbox(temp_workspace, default_policy):
-    """Create PythonSandbox instance with test configuration."""
-    import uuid
-
-    session_id = str(uuid.uuid4())
-    storage_adapter = DiskStorageAdapter(temp_workspace)
-
-    # Create session workspace and metadata
-    if not storage_adapter.session_exists(session_id):
-        storage_adapter.create_session(session_id)
+    """Create PythonSandbox instance with test configuration.
 
+    The session workspace is created lazily by execute(), so tests that only
+    inspect attributes or validate code never touch the filesystem.
+    """
     return PythonSandbox(
         wasm_binary_path="bin/python.wasm",
         policy=default_policy,
-        session_id=session_id,
-        storage_adapter=storage_adapter,
+        session_id=str(uuid.uuid4()),
+        storage_adapter=DiskStorageAdapter(temp_workspace),
     )
 
 
-@pytest.fixture
-def capture_logger():
-    """Create logger with structlog for log capture."""
-    import structlog
-
-    # Configure structlog for testing
-    structlog.configure(
-        processors=[
-            structlog.processors.add_log_level,
-            structlog.processors.JSONRenderer(),
-        ],
-        wrapper_class=structlog.BoundLogger,
-        context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
-        cache_logger_on_first_use=False,
-    )
+def _fast_write(path, data):
+    """Write host-side fixture bytes with a single unbuffered os.write."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
 
-    return SandboxLogger(structlog.get_logger("test-sandbox"))
+
+def _tmp_entry_names(root, prefix):
+    """Return names of entries in `root` starting with `prefix`, via one scandir pass."""
+    with os.scandir(root) as it:
+        return {entry.name for entry in it if entry.name.startswith(prefix)}
 
 
 class TestPythonSandboxBasics:
@@ -79,8 +72,6 @@ class TestPythonSandboxBasics:
 
     def test_init_sets_attributes(self, temp_workspace, default_policy):
         """Test that __init__ sets wasm_binary_path, policy, session_id, storage_adapter, logger."""
-        import uuid
-
         session_id = str(uuid.uuid4())
         storage_adapter = DiskStorageAdapter(temp_workspace)
 
@@ -100,8 +91,6 @@ class TestPythonSandboxBasics:
 
     def test_init_with_custom_logger(self, temp_workspace, default_policy, capture_logger):
         """Test that __init__ accepts custom logger."""
-        import uuid
-
         session_id = str(uuid.uuid4())
         storage_adapter = DiskStorageAdapter(temp_workspace)
 
@@ -115,119 +104,202 @@ class TestPythonSandboxBasics:
 
         assert sandbox.logger == capture_logger
 
+    def test_snapshot_workspace_walks_nested_files(self, python_sandbox, tmp_path):
+        """Workspace snapshots key nested files by POSIX path and skip symlinked dirs."""
+        workspace = python_sandbox.workspace
+        (workspace / "data" / "raw").mkdir(parents=True)
+        _fast_write(workspace / "user_code.py", b"pass")
+        _fast_write(workspace / "top.txt", b"1")
+        _fast_write(workspace / "data" / "raw" / "deep.csv", b"a,b")
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        _fast_write(outside / "hidden.txt", b"x")
+        try:
+            (workspace / "link").symlink_to(outside, target_is_directory=True)
+        except OSError:
+            pytest.skip("symlinks not supported on this platform")
+
+        snapshot = python_sandbox._snapshot_workspace(exclude="user_code.py")
+
+        assert set(snapshot) == {"top.txt", "data/raw/deep.csv"}
+        assert snapshot["top.txt"] == (workspace / "top.txt").stat().st_mtime
 
-class TestPythonSandboxExecution:
-    """Test PythonSandbox execute() method with various code scenarios."""
+    def test_missing_wasm_binary_raises_file_not_found(self, temp_workspace, default_policy):
+        """Missing WASM binaries should raise instead of returning a result."""
+        storage_adapter = DiskStorageAdapter(temp_workspace)
 
-    def test_successful_execution_returns_sandbox_result(self, python_sandbox):
-        """Test that successful execution returns typed SandboxResult."""
-        code = "print('Hello from WASM')"
-        result = python_sandbox.execute(code)
+        sandbox = PythonSandbox(
+            wasm_binary_path="bin/missing-python.wasm",
+            policy=default_policy,
+            session_id=str(uuid.uuid4()),
+            storage_adapter=storage_adapter,
+        )
 
-        assert isinstance(result, SandboxResult)
-        assert result.success is True
-        assert "Hello from WASM" in result.stdout
-        assert (
-            result.stderr == "" or "ResourceWarning" in result.stderr
-        )  # Python may emit resource warnings
-        assert result.exit_code == 0
-        assert result.fuel_consumed is None or result.fuel_consumed > 0
-        assert result.duration_ms > 0
-        assert result.metadata.get("stdout_truncated") is False
-        assert result.metadata.get("stderr_truncated") is False
+        with pytest.raises(FileNotFoundError):
+            sandbox.execute("print('test')")
 
-    def test_execute_with_inject_setup_true(self, python_sandbox):
-        """Test execute with inject_setup=True adds sys.path for vendored packages."""
-        code = "import sys; print('/data/site-packages' in sys.path)"
-        result = python_sandbox.execute(code, inject_setup=True)
 
-        assert isinstance(result, SandboxResult)
-        assert "True" in result.stdout
+@pytest.fixture(scope="class")
+def shared_sandbox(tmp_path_factory, default_policy):
+    """One PythonSandbox reused by every case of a test class.
 
-    def test_execute_with_inject_setup_false(self, python_sandbox):
-        """Test execute with inject_setup=False skips sys.path setup."""
-        code = "import sys; print('/data/site-packages' in sys.path)"
-        result = python_sandbox.execute(code, inject_setup=False)
+    For scenarios that only inspect their own SandboxResult, so sharing the
+    session workspace between them changes nothing they assert on.
+    """
+    return PythonSandbox(
+        wasm_binary_path="bin/python.wasm",
+        policy=default_policy,
+        session_id=str(uuid.uuid4()),
+        storage_adapter=DiskStorageAdapter(tmp_path_factory.mktemp("shared")),
+    )
 
-        assert isinstance(result, SandboxResult)
-        # Without injection, path check should be False (unless already in sys.path)
-        assert (
-            "False" in result.stdout or "True" in result.stdout
-        )  # Depends on Python default paths
 
-    def test_execute_with_stdout_capture(self, python_sandbox):
-        """Test that stdout is captured correctly."""
-        code = """
-print("Line 1")
-print("Line 2")
-print("Line 3")
-"""
-        result = python_sandbox.execute(code)
+# Matches whole "Line N" output lines so one scan checks content and order
+_LINE_PATTERN = re.compile(r"^(Line \d+)$", re.MULTILINE)
 
-        assert "Line 1" in result.stdout
-        assert "Line 2" in result.stdout
-        assert "Line 3" in result.stdout
 
-    def test_execute_with_stderr_capture(self, python_sandbox):
-        """Test that stderr is captured correctly."""
-        code = """
-import sys
-print("Error message", file=sys.stderr)
-"""
-        result = python_sandbox.execute(code)
+def _check_successful_execution(result):
+    """Successful execution returns a typed SandboxResult with metrics."""
+    assert result.success is True
+    assert "Hello from WASM" in result.stdout
+    # Python may emit resource warnings
+    assert result.stderr == "" or "ResourceWarning" in result.stderr
+    assert result.exit_code == 0
+    assert result.fuel_consumed is None or result.fuel_consumed > 0
+    assert result.duration_ms > 0
+    assert result.metadata.get("stdout_truncated") is False
+    assert result.metadata.get("stderr_truncated") is False
+    assert result.memory_used_bytes > 0
+    assert "memory_pages" in result.metadata
 
-        assert "Error message" in result.stderr
-        assert result.metadata.get("stderr_truncated") is False
 
-    def test_execute_with_guest_error(self, python_sandbox):
-        """Test that guest code errors are captured (not raised as host exceptions)."""
-        code = """
+def _check_inject_setup_true(result):
+    """inject_setup=True adds sys.path for vendored packages."""
+    assert "True" in result.stdout
+
+
+def _check_inject_setup_false(result):
+    """inject_setup=False skips sys.path setup."""
+    # Without injection the path may still be present by default
+    assert "False" in result.stdout or "True" in result.stdout
+
+
+def _check_stdout_and_stderr(result):
+    """stdout and stderr are captured separately from one execution."""
+    assert _LINE_PATTERN.findall(result.stdout) == ["Line 1", "Line 2", "Line 3"]
+    assert "Error message" not in result.stdout
+
+    assert "Error message" in result.stderr
+    assert _LINE_PATTERN.findall(result.stderr) == []
+    assert result.metadata.get("stderr_truncated") is False
+
+
+def _check_guest_error(result):
+    """Guest code errors are captured, not raised as host exceptions."""
+    # Guest errors may appear in stderr OR cause WASM exit (both are valid)
+    assert (
+        "ValueError" in result.stderr
+        or "Intentional error" in result.stderr
+        or "exit status" in result.stderr
+        or "ExitTrap" in result.stderr
+    )
+    assert result.success is False
+    assert result.exit_code != 0
+
+
+EXECUTION_CASES = [
+    pytest.param(
+        "x = [i for i in range(1000)]; print('Hello from WASM')",
+        {},
+        _check_successful_execution,
+        id="successful_execution",
+    ),
+    pytest.param(
+        "import sys; print('/data/site-packages' in sys.path)",
+        {"inject_setup": True},
+        _check_inject_setup_true,
+        id="inject_setup_true",
+    ),
+    pytest.param(
+        "import sys; print('/data/site-packages' in sys.path)",
+        {"inject_setup": False},
+        _check_inject_setup_false,
+        id="inject_setup_false",
+    ),
+    pytest.param(
+        """
+import sys
+print("Line 1")
+print("Error message", file=sys.stderr)
+print("Line 2")
+print("Line 3")
+""",
+        {},
+        _check_stdout_and_stderr,
+        id="stdout_and_stderr",
+    ),
+    pytest.param(
+        """
 raise ValueError("Intentional error from guest")
-"""
-        result = python_sandbox.execute(code)
+""",
+        {},
+        _check_guest_error,
+        id="guest_error",
+    ),
+]
 
-        # Execution should complete and capture the error in stderr or as WASM exit
-        assert isinstance(result, SandboxResult)
-        # Guest errors may appear in stderr OR cause WASM exit (both are valid)
-        assert (
-            "ValueError" in result.stderr
-            or "Intentional error" in result.stderr
-            or "exit status" in result.stderr
-            or "ExitTrap" in result.stderr
-        )
-        assert result.success is False
-        assert result.exit_code != 0
 
-    def test_execute_captures_metrics(self, python_sandbox):
-        """Test that execution metrics (duration, fuel, memory) are captured."""
-        code = "x = [i for i in range(1000)]"
-        result = python_sandbox.execute(code)
+@pytest.mark.wasm
+@pytest.mark.usefixtures("wasm_runtime")
+class TestPythonSandboxExecution:
+    """Test PythonSandbox execute() method with various code scenarios."""
 
-        assert result.duration_ms > 0
-        assert result.fuel_consumed is None or result.fuel_consumed > 0
-        assert result.memory_used_bytes > 0
-        assert "memory_pages" in result.metadata
+    def test_execute_creates_session_on_first_use(self, python_sandbox):
+        """Session workspace and metadata are created by execute(), not __init__."""
+        assert not python_sandbox.workspace.exists()
 
-    def test_missing_wasm_binary_raises_file_not_found(self, temp_workspace, default_policy):
-        """Missing WASM binaries should raise instead of returning a result."""
-        import uuid
+        result = python_sandbox.execute("pass")
 
-        storage_adapter = DiskStorageAdapter(temp_workspace)
+        assert result.success is True
+        assert (python_sandbox.workspace / ".metadata.json").is_file()
 
-        sandbox = PythonSandbox(
-            wasm_binary_path="bin/missing-python.wasm",
-            policy=default_policy,
-            session_id=str(uuid.uuid4()),
-            storage_adapter=storage_adapter,
-        )
+    @pytest.mark.parametrize(("code", "kwargs", "check"), EXECUTION_CASES)
+    def test_execute_case(self, shared_sandbox, code, kwargs, check):
+        """Run one execution scenario on the class-wide sandbox and check its result."""
+        result = shared_sandbox.execute(code, **kwargs)
 
-        with pytest.raises(FileNotFoundError):
-            sandbox.execute("print('test')")
+        assert isinstance(result, SandboxResult)
+        check(result)
 
 
+@pytest.mark.wasm
+@pytest.mark.usefixtures("wasm_runtime")
 class TestPythonSandboxFileDetection:
     """Test file delta detection (created/modified files)."""
 
+    def test_file_delta_all_cases(self, python_sandbox):
+        """Created, modified and excluded files are classified in one execution.
+
+        Covers the same ground as the slow-marked per-case tests below while
+        paying for a single guest instantiation.
+        """
+        python_sandbox.workspace.mkdir(parents=True, exist_ok=True)
+        _fast_write(python_sandbox.workspace / "existing.txt", b"Original content")
+
+        code = """
+with open('/app/created.txt', 'w') as f:
+    f.write('Generated content')
+with open('/app/existing.txt', 'w') as f:
+    f.write('Modified content')
+"""
+        result = python_sandbox.execute(code)
+
+        assert result.files_created == ["created.txt"]
+        assert result.files_modified == ["existing.txt"]
+        assert "user_code.py" not in result.files_created
+        assert "user_code.py" not in result.files_modified
+
+    @pytest.mark.slow
     def test_file_delta_detects_created_files(self, python_sandbox):
         """Test that files created during execution are detected."""
         code = """
@@ -239,12 +311,13 @@ with open('/app/output.txt', 'w') as f:
         assert "output.txt" in result.files_created
         assert len(result.files_modified) == 0
 
+    @pytest.mark.slow
     def test_file_delta_detects_modified_files(self, python_sandbox):
         """Test that files modified during execution are detected."""
         # Create file before execution - ensure parent directory exists
         python_sandbox.workspace.mkdir(parents=True, exist_ok=True)
         existing_file = python_sandbox.workspace / "existing.txt"
-        existing_file.write_text("Original content")
+        _fast_write(existing_file, b"Original content")
 
         code = """
 with open('/app/existing.txt', 'w') as f:
@@ -255,6 +328,7 @@ with open('/app/existing.txt', 'w') as f:
         assert "existing.txt" in result.files_modified
         assert "existing.txt" not in result.files_created
 
+    @pytest.mark.slow
     def test_file_delta_excludes_user_code(self, python_sandbox):
         """Test that user_code.py is not reported in file delta."""
         code = "pass"
@@ -273,31 +347,39 @@ for i in range(3):
         result = python_sandbox.execute(code)
 
         assert len(result.files_created) == 3
-        assert "file_0.txt" in result.files_created
-        assert "file_1.txt" in result.files_created
-        assert "file_2.txt" in result.files_created
-
+        assert {"file_0.txt", "file_1.txt", "file_2.txt"} <= set(result.files_created)
 
-class TestPythonSandboxValidation:
-    """Test validate_code() syntax checking."""
 
-    def test_validate_code_returns_true_for_valid_syntax(self, python_sandbox):
-        """Test that validate_code returns True for syntactically valid code."""
-        code = "print('Valid Python code')"
-        assert python_sandbox.validate_code(code) is True
+COMPLEX_CLASS_SRC = """
+class MyClass:
+    def __init__(self, value):
+        self.value = value
 
-    def test_validate_code_returns_false_for_syntax_errors(self, python_sandbox):
-        """Test that validate_code returns False for syntax errors."""
-        code = "print('Missing closing quote"
-        assert python_sandbox.validate_code(code) is False
+    def process(self):
+        return [x**2 for x in range(self.value)]
 
-    def test_validate_code_returns_false_for_invalid_indentation(self, python_sandbox):
-        """Test that validate_code detects indentation errors."""
-        code = """
-def func():
-x = 1
+obj = MyClass(10)
+result = obj.process()
 """
-        assert python_sandbox.validate_code(code) is False
+
+VALIDATION_CASES = [
+    pytest.param("print('Valid Python code')", True, id="valid_syntax"),
+    pytest.param("print('Missing closing quote", False, id="syntax_error"),
+    pytest.param("\ndef func():\nx = 1\n", False, id="invalid_indentation"),
+    pytest.param(COMPLEX_CLASS_SRC, True, id="complex_syntax"),
+    # Rejected by the compiler but accepted by ast.parse()
+    pytest.param("return 1", False, id="return_outside_function"),
+    pytest.param("nonlocal x", False, id="nonlocal_at_module_level"),
+]
+
+
+class TestPythonSandboxValidation:
+    """Test validate_code() syntax checking."""
+
+    @pytest.mark.parametrize(("code", "expected"), VALIDATION_CASES)
+    def test_validate_code(self, python_sandbox, code, expected):
+        """Test that validate_code accepts valid syntax and rejects syntax errors."""
+        assert python_sandbox.validate_code(code) is expected
 
     def test_validate_code_does_not_execute(self, python_sandbox):
         """Test that validate_code does not execute code or have side effects."""
@@ -311,47 +393,82 @@ with open('/app/should_not_exist.txt', 'w') as f:
         should_not_exist = python_sandbox.workspace / "should_not_exist.txt"
         assert not should_not_exist.exists()
 
-    def test_validate_code_accepts_complex_syntax(self, python_sandbox):
-        """Test that validate_code handles complex valid syntax."""
-        code = """
-class MyClass:
-    def __init__(self, value):
-        self.value = value
-
-    def process(self):
-        return [x**2 for x in range(self.value)]
-
-obj = MyClass(10)
-result = obj.process()
-"""
-        assert python_sandbox.validate_code(code) is True
-
     def test_validate_code_uses_sandbox_filename(self, python_sandbox, monkeypatch):
         """Validate code should compile using the <sandbox> filename sentinel."""
-        import builtins
-
         captured: dict[str, str] = {}
-        real_compile = builtins.compile
 
-        def fake_compile(source: str, filename: str, mode: str):
+        def fake_compile(source: str, filename: str, mode: str, **kwargs):
             captured["filename"] = filename
-            return real_compile(source, filename, mode)
+            captured["mode"] = mode
+            return builtins.compile(source, filename, mode, **kwargs)
 
-        monkeypatch.setattr(builtins, "compile", fake_compile)
+        monkeypatch.setattr(python_sandbox_module, "compile", fake_compile, raising=False)
+        _compiles_cached.cache_clear()
 
         assert python_sandbox.validate_code("x = 1") is True
         assert captured["filename"] == "<sandbox>"
+        assert captured["mode"] == "exec"
+
+    def test_validate_code_uses_optimize_flag(self, python_sandbox, monkeypatch):
+        """Validate code should skip debug codegen and host __future__ flags."""
+        captured: dict[str, object] = {}
+
+        def fake_compile(source: str, filename: str, mode: str, **kwargs):
+            captured.update(kwargs)
+            return builtins.compile(source, filename, mode, **kwargs)
+
+        monkeypatch.setattr(python_sandbox_module, "compile", fake_compile, raising=False)
+        _compiles_cached.cache_clear()
+
+        assert python_sandbox.validate_code("assert x, 'doc'") is True
+        assert captured["optimize"] == 2
+        assert captured["dont_inherit"] is True
+
+    def test_validate_code_caches_by_source(self, python_sandbox, monkeypatch):
+        """Repeated validation of the same source should compile it only once."""
+        calls: list[str] = []
+
+        def fake_compile(source: str, filename: str, mode: str, **kwargs):
+            calls.append(source)
+            return builtins.compile(source, filename, mode, **kwargs)
 
+        monkeypatch.setattr(python_sandbox_module, "compile", fake_compile, raising=False)
+        _compiles_cached.cache_clear()
 
+        assert python_sandbox.validate_code("y = 2") is True
+        assert python_sandbox.validate_code("y = 2") is True
+        assert calls == ["y = 2"]
+
+    def test_validate_code_does_not_cache_large_sources(self, python_sandbox, monkeypatch):
+        """Sources over the size limit should be compiled each time, not retained."""
+        calls: list[str] = []
+
+        def fake_compile(source: str, filename: str, mode: str, **kwargs):
+            calls.append(source)
+            return builtins.compile(source, filename, mode, **kwargs)
+
+        monkeypatch.setattr(python_sandbox_module, "compile", fake_compile, raising=False)
+        _compiles_cached.cache_clear()
+        code = "x = 1\n" * (_SYNTAX_CACHE_MAX_CHARS // 6 + 1)
+
+        assert python_sandbox.validate_code(code) is True
+        assert python_sandbox.validate_code(code) is True
+        assert len(calls) == 2
+        assert _compiles_cached.cache_info().currsize == 0
+
+
+@pytest.mark.wasm
+@pytest.mark.usefixtures("wasm_runtime")
 class TestPythonSandboxSecurityBoundaries:
     """Test security boundaries (fuel exhaustion, FS isolation, memory limits)."""
 
     def test_fuel_exhaustion_does_not_raise(self, temp_workspace):
         """Test that fuel exhaustion is handled gracefully (captured, not raised)."""
-        # Use very low fuel budget to trigger exhaustion
-        import uuid
-
-        policy = ExecutionPolicy(fuel_budget=100_000)
+        # Use very low fuel budget to trigger exhaustion. 1k instructions
+        # runs out during CPython startup, before the user loop is reached, so
+        # the trap fires as early as possible. The exact point of exhaustion is
+        # not part of the contract; only that it is captured as out_of_fuel.
+        policy = ExecutionPolicy(fuel_budget=1_000)
         session_id = str(uuid.uuid4())
         storage_adapter = DiskStorageAdapter(temp_workspace)
 
@@ -363,15 +480,16 @@ class TestPythonSandboxSecurityBoundaries:
         )
 
         code = """
+x = 0
 while True:
-    pass
+    x += 1
 """
         result = sandbox.execute(code)
 
         # Execution should complete with OutOfFuel trap captured
         assert isinstance(result, SandboxResult)
-        # Fuel should be near or at budget
-        assert result.fuel_consumed >= 0
+        # Fuel should be exhausted exactly at the budget
+        assert result.fuel_consumed == policy.fuel_budget
         assert result.success is False
         assert result.exit_code != 0
         assert result.metadata.get("trap_reason") == "out_of_fuel"
@@ -392,25 +510,47 @@ except Exception as e:
         assert "BLOCKED" in result.stdout
         assert "SUCCESS" not in result.stdout
 
-    def test_memory_limit_enforcement(self, temp_workspace):
-        """Test that memory limits are configured (actual enforcement depends on wasmtime version)."""
-        # Use small memory limit
-        import uuid
+    def test_memory_limit_enforcement(self, temp_workspace, monkeypatch):
+        """Test that policy.memory_bytes is applied as the Store memory limit."""
+        limits: list[dict[str, int]] = []
+
+        class RecordingStore(sandbox_host.Store):
+            def set_limits(self, **kwargs):
+                limits.append(kwargs)
+                super().set_limits(**kwargs)
+
+        monkeypatch.setattr(sandbox_host, "Store", RecordingStore)
 
         policy = ExecutionPolicy(memory_bytes=10_000_000)  # 10 MB
-        session_id = str(uuid.uuid4())
-        storage_adapter = DiskStorageAdapter(temp_workspace)
+        sandbox = PythonSandbox(
+            wasm_binary_path="bin/python.wasm",
+            policy=policy,
+            session_id=str(uuid.uuid4()),
+            storage_adapter=DiskStorageAdapter(temp_workspace),
+        )
 
+        result = sandbox.execute("print('ok')")
+
+        assert limits == [{"memory_size": 10_000_000}]
+        # 10 MB is below CPython's initial 160-page memory, so the limit is
+        # enforced at instantiation without the guest allocating anything
+        assert result.success is False
+        assert result.metadata.get("trap_reason") == "memory_limit"
+
+    @pytest.mark.slow
+    def test_memory_limit_blocks_large_allocation(self, temp_workspace):
+        """Test that a guest allocation beyond memory_bytes raises MemoryError."""
+        policy = ExecutionPolicy(memory_bytes=32 * 1024 * 1024)  # 32 MiB
         sandbox = PythonSandbox(
             wasm_binary_path="bin/python.wasm",
             policy=policy,
-            session_id=session_id,
-            storage_adapter=storage_adapter,
+            session_id=str(uuid.uuid4()),
+            storage_adapter=DiskStorageAdapter(temp_workspace),
         )
 
         code = """
 try:
-    # Try to allocate large array (may hit memory limit)
+    # 10**7 list slots need ~80 MB, well past the limit
     big_list = [0] * (10**7)
     print('Allocated large list')
 except MemoryError:
@@ -418,19 +558,20 @@ except MemoryError:
 """
         result = sandbox.execute(code)
 
-        # Memory limits are best-effort depending on wasmtime version
-        # Just verify execution completes and metrics are captured
         assert isinstance(result, SandboxResult)
-        assert result.memory_used_bytes > 0
+        assert "BLOCKED: MemoryError" in result.stdout
+        assert result.memory_used_bytes <= policy.memory_bytes
 
 
+@pytest.mark.wasm
+@pytest.mark.usefixtures("wasm_runtime")
 class TestPythonSandboxLogging:
     """Test logging integration with SandboxLogger."""
 
-    def test_logging_execution_start_emitted(self, temp_workspace, default_policy, capture_logger):
+    def test_logging_execution_start_emitted(
+        self, temp_workspace, default_policy, capture_logger, logged_events
+    ):
         """Test that log_execution_start is called during execute()."""
-        import uuid
-
         session_id = str(uuid.uuid4())
         storage_adapter = DiskStorageAdapter(temp_workspace)
 
@@ -449,13 +590,12 @@ class TestPythonSandboxLogging:
 
         # If no errors, logging integration works
         assert isinstance(result, SandboxResult)
+        assert "execution.start" in logged_events()
 
     def test_logging_execution_complete_emitted(
-        self, temp_workspace, default_policy, capture_logger
+        self, temp_workspace, default_policy, capture_logger, logged_events
     ):
         """Test that log_execution_complete is called after execute()."""
-        import uuid
-
         session_id = str(uuid.uuid4())
         storage_adapter = DiskStorageAdapter(temp_workspace)
 
@@ -473,8 +613,11 @@ class TestPythonSandboxLogging:
         # Verify result contains expected fields that would be logged
         assert result.fuel_consumed is None or result.fuel_consumed >= 0
         assert result.duration_ms > 0
+        assert "execution.complete" in logged_events()
 
 
+@pytest.mark.wasm
+@pytest.mark.usefixtures("wasm_runtime")
 class TestPythonSandboxWorkspace:
     """Test workspace path handling and result population."""
 
@@ -485,23 +628,23 @@ class TestPythonSandboxWorkspace:
 
         assert result.workspace_path == str(python_sandbox.workspace)
 
-    def test_logs_dir_cleaned_by_default(self, python_sandbox):
+    def test_logs_dir_cleaned_by_default(self, python_sandbox, tmp_path, monkeypatch):
         """Logs are cleaned up unless explicitly preserved."""
-        before = set(Path(tempfile.gettempdir()).glob("wasm-python-*"))
+        # Private tempdir so concurrent xdist workers' log dirs are not counted
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        tmp_root = tempfile.gettempdir()
+        before = _tmp_entry_names(tmp_root, "wasm-python-")
 
         code = "print('Test')"
         result = python_sandbox.execute(code)
 
-        after = set(Path(tempfile.gettempdir()).glob("wasm-python-*"))
-        created = [p for p in after if p not in before]
+        created = _tmp_entry_names(tmp_root, "wasm-python-") - before
 
         assert result.metadata.get("logs_dir") is None
-        assert all(not p.exists() for p in created)
+        assert all(not (Path(tmp_root) / name).exists() for name in created)
 
     def test_logs_dir_preserved_when_requested(self, temp_workspace):
         """Preserve logs when policy opts in."""
-        import uuid
-
         session_id = str(uuid.uuid4())
         policy = ExecutionPolicy(preserve_logs=True)
         storage_adapter = DiskStorageAdapter(temp_workspace)
@@ -520,13 +663,13 @@ class TestPythonSandboxWorkspace:
         shutil.rmtree(result.metadata["logs_dir"], ignore_errors=True)
 
 
+@pytest.mark.wasm
+@pytest.mark.usefixtures("wasm_runtime")
 class TestPythonSandboxTruncation:
     """Test truncation signaling for stdout/stderr caps."""
 
     def test_truncation_flags_set(self, temp_workspace):
         """Ensure stdout/stderr truncation is reflected in metadata."""
-        import uuid
-
         policy = ExecutionPolicy(stdout_max_bytes=50, stderr_max_bytes=50)
         session_id = str(uuid.uuid4())
         storage_adapter = DiskStorageAdapter(temp_workspace)
@@ -550,47 +693,50 @@ print("B" * 200, file=sys.stderr)
         assert result.metadata.get("stderr_truncated") is True
 
 
+@pytest.fixture(scope="class")
+def shared_persist_sandbox(tmp_path_factory):
+    """One auto_persist_globals sandbox shared by a whole test class."""
+    return create_sandbox(
+        runtime=RuntimeType.PYTHON,
+        auto_persist_globals=True,
+        workspace_root=tmp_path_factory.mktemp("persist"),
+    )
+
+
+@pytest.fixture
+def persist_sandbox(shared_persist_sandbox):
+    """Shared auto-persisting sandbox with previously persisted globals cleared."""
+    (shared_persist_sandbox.workspace / STATE_FILENAME).unlink(missing_ok=True)
+    return shared_persist_sandbox
+
+
+@pytest.mark.wasm
+@pytest.mark.usefixtures("wasm_runtime")
 class TestPythonSandboxStatePersistence:
     """Test state persistence with auto_persist_globals."""
 
-    def test_file_handle_not_serialized_with_context_manager(self, temp_workspace):
+    def test_file_handle_not_serialized_with_context_manager(self, persist_sandbox):
         """Test that file handles from 'with open()' pattern don't break state serialization.
 
         Regression test for bug where file handles remaining in globals after
         a context manager block would cause state serialization to fail with:
         TypeError: Object of type TextIOWrapper is not JSON serializable
         """
-        from sandbox import RuntimeType, create_sandbox
-
-        sandbox = create_sandbox(
-            runtime=RuntimeType.PYTHON,
-            auto_persist_globals=True,
-            workspace_root=temp_workspace,
-        )
-
         # This pattern would previously fail due to 'f' remaining in globals
         code = """
 with open('/app/test.txt', 'w') as f:
     f.write('hello')
 counter = 42
 """
-        result = sandbox.execute(code)
+        result = persist_sandbox.execute(code)
 
         assert result.success is True
         assert result.exit_code == 0
         # Verify file was created
         assert "test.txt" in result.files_created
 
-    def test_file_handle_not_serialized_explicit_open(self, temp_workspace):
+    def test_file_handle_not_serialized_explicit_open(self, persist_sandbox):
         """Test that explicit file handles are filtered from state serialization."""
-        from sandbox import RuntimeType, create_sandbox
-
-        sandbox = create_sandbox(
-            runtime=RuntimeType.PYTHON,
-            auto_persist_globals=True,
-            workspace_root=temp_workspace,
-        )
-
         # Explicit open/close, 'f' variable still exists in globals
         code = """
 f = open('/app/test2.txt', 'w')
@@ -598,21 +744,13 @@ f.write('world')
 f.close()
 counter = 42
 """
-        result = sandbox.execute(code)
+        result = persist_sandbox.execute(code)
 
         assert result.success is True
         assert result.exit_code == 0
 
-    def test_state_persists_after_file_operations(self, temp_workspace):
+    def test_state_persists_after_file_operations(self, persist_sandbox):
         """Test that state is correctly persisted across file I/O operations."""
-        from sandbox import RuntimeType, create_sandbox
-
-        sandbox = create_sandbox(
-            runtime=RuntimeType.PYTHON,
-            auto_persist_globals=True,
-            workspace_root=temp_workspace,
-        )
-
         # First execution: file I/O with state
         code1 = """
 with open('/app/data.txt', 'w') as f:
@@ -620,7 +758,7 @@ with open('/app/data.txt', 'w') as f:
 counter = 1
 items = ['a', 'b']
 """
-        result1 = sandbox.execute(code1)
+        result1 = persist_sandbox.execute(code1)
         assert result1.success is True
 
         # Second execution: verify state persisted
@@ -630,7 +768,7 @@ items.append('c')
 print(f'counter={counter}')
 print(f'items={items}')
 """
-        result2 = sandbox.execute(code2)
+        result2 = persist_sandbox.execute(code2)
         assert result2.success is True
         assert "counter=2" in result2.stdout
         assert "items=['a', 'b', 'c']" in result2.stdout
@@ -5,217 +5,208 @@ Tests stdout capture, WASI preopens, and exit codes.
 QuickJS-NG provides a standalone qjs-wasi.wasm with standard _start entry point.
 """
 
+import os
 import tempfile
 from pathlib import Path
 
+import pytest
 import wasmtime
 
-
-def test_quickjs_hello_world():
-    """Test basic QuickJS execution with console.log output."""
-    # Paths
-    wasm_path = Path("bin/quickjs.wasm")
-    assert wasm_path.exists(), (
-        f"QuickJS binary not found at {wasm_path}. Run scripts/fetch_quickjs.ps1 first."
-    )
-
-    # Create temporary workspace
-    with tempfile.TemporaryDirectory() as tmpdir:
-        workspace = Path(tmpdir)
-        code_file = workspace / "test.js"
-        code_file.write_text("console.log('Hello from QuickJS-NG!');")
-
-        # Configure WASI
-        engine = wasmtime.Engine()
-        store = wasmtime.Store(engine)
-
-        # Create WASI configuration with preopens and stdio capture
-        wasi = wasmtime.WasiConfig()
-        wasi.preopen_dir(str(workspace), "/app")
-
-        # Capture stdout/stderr
-        stdout_file = workspace / "stdout.txt"
-        stderr_file = workspace / "stderr.txt"
-        wasi.stdout_file = str(stdout_file)
-        wasi.stderr_file = str(stderr_file)
-
-        # Set argv (QuickJS-NG qjs expects: qjs [options] script.js)
-        wasi.argv = ["qjs", "/app/test.js"]
-
-        store.set_wasi(wasi)
-
-        # Load and instantiate the WASM module
+QUICKJS_WASM = Path("bin/quickjs.wasm")
+
+# One stat at collection time instead of a failing assert in every test
+pytestmark = pytest.mark.skipif(
+    not QUICKJS_WASM.exists(),
+    reason="bin/quickjs.wasm not built (run scripts/fetch_quickjs.ps1)",
+)
+
+
+def _load_quickjs(wasm_path=QUICKJS_WASM, cache_dir=None):
+    """Compile wasm_path and return a WASI-enabled (engine, linker, module).
+
+    When cache_dir is given, the compiled module is serialized there as
+    <mtime_ns>-<size>.cwasm and deserialized on later runs, so the binary is
+    only recompiled after it changes. An artifact this wasmtime build cannot
+    load is ignored and replaced.
+    """
+    engine = wasmtime.Engine()
+    module = None
+    cached = None
+    if cache_dir is not None:
+        st = wasm_path.stat()
+        cached = Path(cache_dir) / f"quickjs-{st.st_mtime_ns}-{st.st_size}.cwasm"
+        if cached.exists():
+            try:
+                module = wasmtime.Module.deserialize_file(engine, str(cached))
+            except wasmtime.WasmtimeError:
+                module = None
+    if module is None:
         module = wasmtime.Module.from_file(engine, str(wasm_path))
-        linker = wasmtime.Linker(engine)
-        linker.define_wasi()
-        instance = linker.instantiate(store, module)
-
-        # Run the module (QuickJS-NG uses _start as entry point)
-        start_func = instance.exports(store).get("_start")
-        assert start_func is not None, "_start function not found in WASM module"
-
-        try:
-            start_func(store)
-            exit_code = 0
-        except wasmtime.ExitTrap as e:
-            exit_code = e.code
-
-        # Explicitly drop store/instance to release file handles on Windows
-        del instance
-        del linker
-        del store
-        del engine
-
-        # Read captured output
-        stdout = stdout_file.read_text() if stdout_file.exists() else ""
-        stderr = stderr_file.read_text() if stderr_file.exists() else ""
-
-        print(f"Exit code: {exit_code}")
-        print(f"Stdout: {stdout.strip()}")
-        print(f"Stderr: {stderr.strip()}")
-
-        # Verify output
-        assert exit_code == 0, f"Expected exit code 0, got {exit_code}"
-        assert "Hello from QuickJS-NG!" in stdout, (
-            f"Expected 'Hello from QuickJS-NG!' in stdout, got: {stdout}"
-        )
-        print("✅ Basic execution test PASSED")
+        if cached is not None:
+            staging = cached.with_suffix(f".{os.getpid()}.tmp")
+            staging.write_bytes(module.serialize())
+            os.replace(staging, cached)
+    linker = wasmtime.Linker(engine)
+    linker.define_wasi()
+    return engine, linker, module
+
+
+@pytest.fixture(scope="session")
+def quickjs_wasm_path():
+    """Check bin/quickjs.wasm once per session and hand out the same Path."""
+    size = QUICKJS_WASM.stat().st_size
+    assert size > 0, f"QuickJS binary at {QUICKJS_WASM} is empty"
+    return QUICKJS_WASM
+
+
+@pytest.fixture(scope="module")
+def quickjs_runtime(pytestconfig, tmp_path_factory, quickjs_wasm_path):
+    """Compile QuickJS once for the module; each test still gets its own Store.
+
+    The compiled artifact is kept in pytest's cache directory across runs, or
+    in a per-session temp dir when the cache plugin is disabled
+    (-p no:cacheprovider).
+    """
+    cache = getattr(pytestconfig, "cache", None)
+    cache_dir = cache.mkdir("wasm") if cache is not None else tmp_path_factory.mktemp("wasm")
+    return _load_quickjs(quickjs_wasm_path, cache_dir)
+
+
+def _start_qjs(engine, linker, module, wasi):
+    """Instantiate QuickJS in a fresh Store, run _start and return the exit code.
+
+    The Store and instance are locals of this function, so they (and the WASI
+    file handles they hold, which matter on Windows) are released as soon as
+    it returns.
+    """
+    store = wasmtime.Store(engine)
+    store.set_wasi(wasi)
+    instance = linker.instantiate(store, module)
+
+    # Run the module (QuickJS-NG uses _start as entry point)
+    start_func = instance.exports(store).get("_start")
+    assert start_func is not None, "_start function not found in WASM module"
 
+    try:
+        start_func(store)
+    except wasmtime.ExitTrap as e:
+        return e.code
+    return 0
 
-def test_quickjs_filesystem_access():
-    """Test that QuickJS can read files from WASI preopen directory."""
-    wasm_path = Path("bin/quickjs.wasm")
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        workspace = Path(tmpdir)
+def _read_capture(path):
+    """Return a stdio capture file's text, or "" if the guest never wrote it.
+
+    One open+read per stream; no separate exists() stat.
+    """
+    try:
+        return path.read_bytes().decode("utf-8", errors="replace")
+    except FileNotFoundError:
+        return ""
+
+
+def _run_qjs(engine, linker, module, workspace, argv):
+    """Run QuickJS with workspace preopened at /app.
+
+    Returns:
+        Tuple of (exit_code, stdout, stderr).
+    """
+    # Create WASI configuration with preopens and stdio capture. wasmtime-py 38
+    # only offers file-backed or inherited stdio (no in-memory or fd sinks), so
+    # the capture still goes through files.
+    wasi = wasmtime.WasiConfig()
+    wasi.preopen_dir(str(workspace), "/app")
+    stdout_file = workspace / "stdout.txt"
+    stderr_file = workspace / "stderr.txt"
+    wasi.stdout_file = str(stdout_file)
+    wasi.stderr_file = str(stderr_file)
+    # QuickJS-NG qjs expects: qjs [options] script.js
+    wasi.argv = argv
+
+    exit_code = _start_qjs(engine, linker, module, wasi)
+
+    return exit_code, _read_capture(stdout_file), _read_capture(stderr_file)
+
+
+def _check_hello_world(exit_code, stdout, stderr):
+    """Basic execution: console.log output reaches captured stdout."""
+    assert exit_code == 0, f"Expected exit code 0, got {exit_code}"
+    assert "Hello from QuickJS-NG!" in stdout, (
+        f"Expected 'Hello from QuickJS-NG!' in stdout, got: {stdout}"
+    )
 
-        # Create a data file in the workspace
-        data_file = workspace / "data.txt"
-        data_file.write_text("Test data from file")
 
-        # Create JS code that reads the file
-        code_file = workspace / "test.js"
-        code_file.write_text("""
+def _check_filesystem_access(exit_code, stdout, stderr):
+    """Reading a preopened file succeeds where require('std') is available."""
+    # QuickJS-NG's WASI build has no CommonJS require(); only a run that gets
+    # past module loading is expected to succeed.
+    if "ReferenceError" in stderr or "require is not defined" in stderr:
+        return
+    assert exit_code == 0, f"Expected exit code 0, got {exit_code}"
+
+
+def _check_exit_codes(exit_code, stdout, stderr):
+    """Uncaught errors produce a non-zero exit code and a message on stderr."""
+    assert exit_code != 0, f"Expected non-zero exit code for error, got {exit_code}"
+    assert "Error" in stderr, f"Expected error message in stderr, got: {stderr}"
+
+
+QUICKJS_CASES = [
+    pytest.param(
+        {"test.js": "console.log('Hello from QuickJS-NG!');"},
+        ["qjs", "/app/test.js"],
+        _check_hello_world,
+        id="hello_world",
+    ),
+    pytest.param(
+        {
+            "data.txt": "Test data from file",
+            "test.js": """
         const fs = require('std');
         const file = fs.open('/app/data.txt', 'r');
         const content = file.readAsString();
         file.close();
         console.log('File content: ' + content);
-        """)
-
-        # Configure WASI
-        engine = wasmtime.Engine()
-        store = wasmtime.Store(engine)
-
-        wasi = wasmtime.WasiConfig()
-        wasi.preopen_dir(str(workspace), "/app")
-
-        stdout_file = workspace / "stdout.txt"
-        stderr_file = workspace / "stderr.txt"
-        wasi.stdout_file = str(stdout_file)
-        wasi.stderr_file = str(stderr_file)
-        wasi.argv = ["quickjs", "/app/test.js"]
-
-        store.set_wasi(wasi)
-
-        # Load and run
-        module = wasmtime.Module.from_file(engine, str(wasm_path))
-        linker = wasmtime.Linker(engine)
-        linker.define_wasi()
-        instance = linker.instantiate(store, module)
-
-        start_func = instance.exports(store).get("_start")
-        try:
-            start_func(store)
-            exit_code = 0
-        except wasmtime.ExitTrap as e:
-            exit_code = e.code
-
-        # Explicitly drop store/instance to release file handles on Windows
-        del instance
-        del linker
-        del store
-        del engine
-
-        stdout = stdout_file.read_text() if stdout_file.exists() else ""
-        stderr = stderr_file.read_text() if stderr_file.exists() else ""
-
-        print(f"\nFilesystem test - Exit code: {exit_code}")
-        print(f"Stdout: {stdout.strip()}")
-        print(f"Stderr: {stderr.strip()}")
-
-        # Note: QuickJS may not have 'std' module - this test might fail
-        # If it does, we'll update the test to use a different approach
-        if "ReferenceError" in stderr or "require is not defined" in stderr:
-            print("⚠️  QuickJS doesn't support require('std') - skipping filesystem test for now")
-        else:
-            assert exit_code == 0, f"Expected exit code 0, got {exit_code}"
-            print("✅ Filesystem access test PASSED")
-
-
-def test_quickjs_exit_codes():
-    """Test that QuickJS properly reports exit codes for errors."""
-    wasm_path = Path("bin/quickjs.wasm")
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        workspace = Path(tmpdir)
-
-        # Create JS code with an error
-        code_file = workspace / "test.js"
-        code_file.write_text("throw new Error('Test error');")
-
-        # Configure WASI
-        engine = wasmtime.Engine()
-        store = wasmtime.Store(engine)
-
-        wasi = wasmtime.WasiConfig()
-        wasi.preopen_dir(str(workspace), "/app")
-
-        stdout_file = workspace / "stdout.txt"
-        stderr_file = workspace / "stderr.txt"
-        wasi.stdout_file = str(stdout_file)
-        wasi.stderr_file = str(stderr_file)
-        wasi.argv = ["quickjs", "/app/test.js"]
-
-        store.set_wasi(wasi)
-
-        # Load and run
-        module = wasmtime.Module.from_file(engine, str(wasm_path))
-        linker = wasmtime.Linker(engine)
-        linker.define_wasi()
-        instance = linker.instantiate(store, module)
-
-        start_func = instance.exports(store).get("_start")
-        try:
-            start_func(store)
-            exit_code = 0
-        except wasmtime.ExitTrap as e:
-            exit_code = e.code
-
-        # Explicitly drop store/instance to release file handles on Windows
-        del instance
-        del linker
-        del store
-        del engine
-
-        stderr = stderr_file.read_text() if stderr_file.exists() else ""
-
-        print(f"\nError test - Exit code: {exit_code}")
-        print(f"Stderr: {stderr.strip()}")
-
-        # Verify error is reported
-        assert exit_code != 0, f"Expected non-zero exit code for error, got {exit_code}"
-        assert "Error" in stderr, f"Expected error message in stderr, got: {stderr}"
-        print("✅ Exit code test PASSED")
+        """,
+        },
+        ["quickjs", "/app/test.js"],
+        _check_filesystem_access,
+        id="filesystem_access",
+    ),
+    pytest.param(
+        {"test.js": "throw new Error('Test error');"},
+        ["quickjs", "/app/test.js"],
+        _check_exit_codes,
+        id="exit_codes",
+    ),
+]
+
+
+@pytest.mark.parametrize(("files", "argv", "check"), QUICKJS_CASES)
+def test_quickjs_binary(quickjs_runtime, temp_workspace, files, argv, check):
+    """Test stdout capture, WASI preopens and exit codes against the raw binary."""
+    for name, content in files.items():
+        (temp_workspace / name).write_text(content)
+
+    check(*_run_qjs(*quickjs_runtime, temp_workspace, argv))
 
 
 if __name__ == "__main__":
     print("Testing QuickJS WASM binary with Wasmtime...\n")
 
     try:
-        test_quickjs_hello_world()
-        test_quickjs_filesystem_access()
-        test_quickjs_exit_codes()
+        assert QUICKJS_WASM.exists(), (
+            f"QuickJS binary not found at {QUICKJS_WASM}. Run scripts/fetch_quickjs.ps1 first."
+        )
+        runtime = _load_quickjs()
+        for case in QUICKJS_CASES:
+            files, argv, check = case.values
+            with tempfile.TemporaryDirectory() as tmpdir:
+                workspace = Path(tmpdir)
+                for name, content in files.items():
+                    (workspace / name).write_text(content)
+                check(*_run_qjs(*runtime, workspace, argv))
+            print(f"✅ {case.id} PASSED")
         print("\n🎉 All QuickJS binary tests passed!")
     except AssertionError as e:
         print(f"\n❌ Test failed: {e}")
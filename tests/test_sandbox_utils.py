@@ -6,46 +6,62 @@ validates security boundaries, and measures resource consumption.
 
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
+import os
+import shutil
 
 import pytest
 
 from sandbox import RuntimeType, create_sandbox
 from sandbox.core.models import ExecutionPolicy
+from sandbox.core.storage import DiskStorageAdapter
 
 
-@pytest.fixture
-def temp_workspace():
-    """Create temporary workspace directory for test isolation."""
-    with tempfile.TemporaryDirectory(
-        prefix="test-workspace-", ignore_cleanup_errors=True
-    ) as tmpdir:
-        yield Path(tmpdir)
+@pytest.fixture(scope="module")
+def python_sandbox(workspace_root):
+    """Create PythonSandbox with vendored packages via read-only /data mount.
 
-
-@pytest.fixture
-def python_sandbox(temp_workspace):
-    """Create PythonSandbox with vendored packages via read-only /data mount."""
+    Shared by the whole module so the session is created once; _reset_app
+    gives each test an empty /app. Under pytest-xdist every worker builds
+    its own copy under its worker-local workspace_root, and all of them
+    read the same vendor/ tree through the mount, so nothing is copied.
+    execute() prepends INJECTED_SETUP, so test code does not touch sys.path.
+    """
     policy = ExecutionPolicy()
     sandbox = create_sandbox(
         runtime=RuntimeType.PYTHON,
-        workspace_root=temp_workspace,
+        workspace_root=workspace_root,
         policy=policy,
     )
 
     return sandbox
 
 
+@pytest.fixture(autouse=True)
+def _reset_app(python_sandbox):
+    """Empty the shared session workspace (/app) before each test.
+
+    Done host-side, which costs a directory scan rather than a guest run.
+    Session metadata is kept so the session stays valid.
+    """
+    workspace = python_sandbox.workspace
+    if not workspace.is_dir():
+        return
+    with os.scandir(workspace) as entries:
+        for entry in entries:
+            if entry.name == DiskStorageAdapter.METADATA_FILENAME:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+
 class TestFilesModule:
     """Test sandbox_utils.files module functions."""
 
     def test_find_basic(self, python_sandbox):
         """Test find() with basic glob pattern."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import find, mkdir, touch
 
 # Create test structure
@@ -69,9 +85,6 @@ for f in sorted(py_files):
     def test_find_non_recursive(self, python_sandbox):
         """Test find() without recursion."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import find, mkdir, touch
 
 mkdir("/app/test/subdir", parents=True)
@@ -90,9 +103,6 @@ print(f"Found {len(files)} files (non-recursive)")
     def test_tree_basic(self, python_sandbox):
         """Test tree() directory visualization."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import tree, mkdir, touch
 
 # Create test structure
@@ -115,9 +125,6 @@ print(tree_output)
     def test_tree_max_depth(self, python_sandbox):
         """Test tree() with depth limit."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import tree, mkdir, touch
 
 # Create deep structure
@@ -141,9 +148,6 @@ else:
     def test_walk_basic(self, python_sandbox):
         """Test walk() directory traversal."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import walk, mkdir, touch
 
 mkdir("/app/test/dir1", parents=True)
@@ -164,9 +168,6 @@ for f in sorted(files):
     def test_walk_with_filter(self, python_sandbox):
         """Test walk() with filter function."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import walk, mkdir, touch
 
 mkdir("/app/test", parents=True)
@@ -185,9 +186,6 @@ print(f"Found {len(py_files)} Python files")
     def test_copy_tree(self, python_sandbox):
         """Test copy_tree() recursive copy."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import copy_tree, mkdir, touch, find
 
 # Create source structure
@@ -209,9 +207,7 @@ print(f"Copied {len(files)} files")
     def test_remove_tree(self, python_sandbox):
         """Test remove_tree() recursive deletion."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
+import os
 from sandbox_utils import remove_tree, mkdir, touch, ls
 from pathlib import Path
 
@@ -220,7 +216,8 @@ mkdir("/app/test/subdir", parents=True)
 touch("/app/test/file1.txt")
 touch("/app/test/subdir/file2.txt")
 
-print(f"Before removal: {len(list(Path('/app/test').rglob('*')))} items")
+items = sum(len(dirs) + len(files) for _, dirs, files in os.walk('/app/test'))
+print(f"Before removal: {items} items")
 
 # Remove entire tree
 remove_tree("/app/test")
@@ -240,9 +237,6 @@ class TestTextModule:
     def test_grep_basic(self, python_sandbox):
         """Test grep() pattern search."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import grep, echo, touch
 
 # Create test files with content
@@ -266,9 +260,6 @@ for file, line_num, line_text in matches:
     def test_grep_non_regex(self, python_sandbox):
         """Test grep() with literal string search."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import grep, echo
 
 echo("Hello [world]", file="/app/test.txt")
@@ -285,9 +276,6 @@ print(f"Found {len(matches)} matches (literal)")
     def test_sed_basic(self, python_sandbox):
         """Test sed() regex replacement."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import sed
 
 text = "Hello world, hello universe"
@@ -303,9 +291,6 @@ print(result)
     def test_head_basic(self, python_sandbox):
         """Test head() first N lines."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import head, echo
 
 # Create multi-line file
@@ -325,9 +310,6 @@ print(first_lines)
     def test_tail_basic(self, python_sandbox):
         """Test tail() last N lines."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import tail, echo
 
 # Create multi-line file
@@ -348,9 +330,6 @@ print(last_lines)
     def test_wc_basic(self, python_sandbox):
         """Test wc() word/line/char count."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import wc, echo
 
 echo("Line 1: Hello world\\nLine 2: Test", file="/app/test.txt")
@@ -369,9 +348,6 @@ print(f"Chars: {stats['chars']}")
     def test_diff_basic(self, python_sandbox):
         """Test diff() file comparison."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import diff, echo
 
 echo("Line 1\\nLine 2\\nLine 3", file="/app/file1.txt")
@@ -392,9 +368,6 @@ class TestDataModule:
     def test_group_by(self, python_sandbox):
         """Test group_by() grouping by key function."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import group_by
 
 words = ["cat", "dog", "bird", "fish", "ant"]
@@ -411,9 +384,6 @@ for length, items in sorted(grouped.items()):
     def test_filter_by(self, python_sandbox):
         """Test filter_by() filtering with predicate."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import filter_by
 
 numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
@@ -427,9 +397,6 @@ print(f"Evens: {evens}")
     def test_map_items(self, python_sandbox):
         """Test map_items() transformation."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import map_items
 
 numbers = [1, 2, 3, 4, 5]
@@ -443,9 +410,6 @@ print(f"Squared: {squared}")
     def test_sort_by(self, python_sandbox):
         """Test sort_by() custom sorting."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import sort_by
 
 words = ["apple", "pie", "cherry", "date"]
@@ -464,9 +428,6 @@ print(f"By length (desc): {by_length_desc}")
     def test_unique(self, python_sandbox):
         """Test unique() deduplication."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import unique
 
 numbers = [1, 2, 2, 3, 4, 4, 5, 1]
@@ -480,9 +441,6 @@ print(f"Unique: {uniq}")
     def test_unique_with_key(self, python_sandbox):
         """Test unique() with custom key function."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import unique
 
 words = ["apple", "Apricot", "banana", "Apple"]
@@ -498,9 +456,6 @@ print(f"Unique (case-insensitive): {uniq}")
     def test_chunk(self, python_sandbox):
         """Test chunk() splitting into chunks."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import chunk
 
 numbers = list(range(1, 11))
@@ -520,9 +475,6 @@ class TestFormatsModule:
     def test_csv_to_json(self, python_sandbox):
         """Test csv_to_json() conversion."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import csv_to_json, echo
 
 # Create CSV file
@@ -542,9 +494,6 @@ print(json_str)
     def test_csv_to_json_with_output_file(self, python_sandbox):
         """Test csv_to_json() with output file."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import csv_to_json, echo, cat
 
 csv_content = "x,y\\n1,2\\n3,4"
@@ -565,9 +514,6 @@ print(result)
     def test_json_to_csv(self, python_sandbox):
         """Test json_to_csv() conversion."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import json_to_csv, echo
 import json
 
@@ -589,9 +535,6 @@ print(csv_str)
     def test_xml_to_dict(self, python_sandbox):
         """Test xml_to_dict() parsing."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import xml_to_dict
 import json
 
@@ -611,9 +554,6 @@ class TestShellModule:
     def test_ls_basic(self, python_sandbox):
         """Test ls() directory listing."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import ls, mkdir, touch
 
 mkdir("/app/test", parents=True)
@@ -631,9 +571,6 @@ print(f"Files: {sorted(files)}")
     def test_ls_long_format(self, python_sandbox):
         """Test ls() with long format."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import ls, mkdir, touch
 
 mkdir("/app/test", parents=True)
@@ -652,9 +589,6 @@ for entry in entries:
     def test_cat_single_file(self, python_sandbox):
         """Test cat() reading single file."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import cat, echo
 
 echo("Hello, World!", file="/app/test.txt")
@@ -668,9 +602,6 @@ print(content)
     def test_cat_multiple_files(self, python_sandbox):
         """Test cat() concatenating multiple files."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import cat, echo
 
 echo("File 1", file="/app/file1.txt")
@@ -687,9 +618,6 @@ print(content)
     def test_touch_creates_file(self, python_sandbox):
         """Test touch() creating empty file."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import touch, ls
 from pathlib import Path
 
@@ -704,9 +632,6 @@ print(f"File exists: {exists}")
     def test_mkdir_creates_directory(self, python_sandbox):
         """Test mkdir() creating directory."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import mkdir
 from pathlib import Path
 
@@ -721,9 +646,6 @@ print(f"Directory exists: {exists}")
     def test_mkdir_with_parents(self, python_sandbox):
         """Test mkdir() creating nested directories."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import mkdir
 from pathlib import Path
 
@@ -738,9 +660,6 @@ print(f"Nested directory exists: {exists}")
     def test_rm_removes_file(self, python_sandbox):
         """Test rm() removing file."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import rm, touch
 from pathlib import Path
 
@@ -756,9 +675,6 @@ print(f"File exists after rm: {exists}")
     def test_rm_recursive(self, python_sandbox):
         """Test rm() removing directory recursively."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import rm, mkdir, touch
 from pathlib import Path
 
@@ -776,9 +692,6 @@ print(f"Directory exists after rm -r: {exists}")
     def test_cp_copies_file(self, python_sandbox):
         """Test cp() copying file."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import cp, echo, cat
 
 echo("Original content", file="/app/source.txt")
@@ -794,9 +707,6 @@ print(content)
     def test_cp_recursive(self, python_sandbox):
         """Test cp() copying directory recursively."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import cp, mkdir, touch, find
 
 mkdir("/app/src/subdir", parents=True)
@@ -815,9 +725,6 @@ print(f"Copied {len(files)} files")
     def test_mv_moves_file(self, python_sandbox):
         """Test mv() moving/renaming file."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import mv, echo, cat
 from pathlib import Path
 
@@ -838,9 +745,6 @@ print(f"New file content: {content}")
     def test_echo_prints_text(self, python_sandbox):
         """Test echo() printing text."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import echo
 
 result = echo("Hello, World!")
@@ -853,9 +757,6 @@ print(result)
     def test_echo_writes_to_file(self, python_sandbox):
         """Test echo() writing to file."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import echo, cat
 
 echo("Line 1", file="/app/output.txt")
@@ -869,9 +770,6 @@ print(content)
     def test_echo_appends_to_file(self, python_sandbox):
         """Test echo() appending to file."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import echo, cat
 
 echo("Line 1", file="/app/output.txt")
@@ -892,9 +790,6 @@ class TestSecurityBoundaries:
     def test_path_escape_prevention_absolute(self, python_sandbox):
         """Test that absolute paths outside /app are rejected."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import ls
 
 try:
@@ -910,9 +805,6 @@ except ValueError as e:
     def test_path_escape_prevention_dotdot(self, python_sandbox):
         """Test that .. traversal outside /app is rejected."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import ls
 
 try:
@@ -928,9 +820,6 @@ except ValueError as e:
     def test_path_validation_all_modules(self, python_sandbox):
         """Test that all modules validate paths."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import find, tree, cat, grep, echo
 
 tests = [
@@ -958,9 +847,6 @@ print(f"\\nPASS: {passed}/{len(tests)} functions validate paths")
     def test_symlink_escape_prevention(self, python_sandbox):
         """Test that symlinks pointing outside /app are rejected by WASI."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import cat
 from pathlib import Path
 import os
@@ -989,9 +875,6 @@ class TestResourceConstraints:
     def test_fuel_consumption_basic_operations(self, python_sandbox):
         """Test that basic operations complete within reasonable fuel budget."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import mkdir, touch, find, ls, cat, echo
 
 # Create moderate structure
@@ -1016,9 +899,6 @@ print(f"PASS: Completed operations on {len(files)} files")
     def test_fuel_consumption_large_find(self, python_sandbox):
         """Test fuel consumption for large find operation."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import mkdir, touch, find
 
 # Create many files
@@ -1039,9 +919,6 @@ print(f"PASS: Found {len(files)} files")
     def test_fuel_consumption_grep_large_text(self, python_sandbox):
         """Test fuel consumption for grep on moderately sized text."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import grep, echo
 
 # Create file with ~100KB of text
@@ -1066,9 +943,6 @@ class TestVendoredPackages:
     def test_tabulate_package(self, python_sandbox):
         """Test tabulate package for pretty-printing tables."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from tabulate import tabulate
 
 data = [
@@ -1089,9 +963,6 @@ print(table)
     def test_python_dateutil_package(self, python_sandbox):
         """Test python-dateutil for date parsing."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from dateutil import parser
 
 date_str = "2024-01-15 14:30:00"
@@ -1107,9 +978,6 @@ print(f"Year: {parsed.year}, Month: {parsed.month}")
     def test_markdown_package(self, python_sandbox):
         """Test markdown package for Markdown conversion."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 import markdown
 
 md_text = "# Hello\\n\\nThis is **bold** text."
@@ -1124,9 +992,6 @@ print(html)
     def test_attrs_package(self, python_sandbox):
         """Test attrs package for data classes."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 import attrs
 
 @attrs.define
@@ -1148,9 +1013,6 @@ class TestIntegrationWorkflows:
     def test_log_analysis_workflow(self, python_sandbox):
         """Test realistic log analysis workflow."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import echo, grep, group_by, wc
 
 # Create sample log file
@@ -1181,9 +1043,6 @@ for error_type, instances in grouped.items():
     def test_data_transformation_workflow(self, python_sandbox):
         """Test data transformation workflow."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import echo, csv_to_json, json_to_csv
 from tabulate import tabulate
 import json
@@ -1216,9 +1075,6 @@ print(table)
     def test_file_organization_workflow(self, python_sandbox):
         """Test file organization workflow."""
         code = """
-import sys
-sys.path.insert(0, '/data/site-packages')
-
 from sandbox_utils import touch, mkdir, find, mv, tree
 
 # Create messy file structure
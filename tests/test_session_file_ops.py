@@ -136,6 +136,41 @@ class TestListSessionFiles:
 
         assert files == []
 
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            "*",
+            "*.py",
+            "**/*.py",
+            "**/**/test_*",
+            ".*",
+            "[lm]*",
+            "lib/*.py",
+            "*/test_*.py",
+            "lib/tests/*",
+            "lib/**/*.py",
+            "**",
+        ],
+    )
+    def test_pattern_matches_rglob(
+        self, session_id: str, temp_workspace: Path, pattern: str
+    ) -> None:
+        """Every pattern lists exactly the files Path.rglob() would."""
+        workspace = temp_workspace / session_id
+        (workspace / "lib" / "tests").mkdir(parents=True)
+        (workspace / "main.py").write_text("")
+        (workspace / ".hidden").write_text("")
+        (workspace / "lib" / "helper.py").write_text("")
+        (workspace / "lib" / "tests" / "test_helper.py").write_text("")
+
+        expected = sorted(
+            p.relative_to(workspace).as_posix() for p in workspace.rglob(pattern) if p.is_file()
+        )
+
+        files = list_session_files(session_id, workspace_root=temp_workspace, pattern=pattern)
+
+        assert files == expected
+
     def test_returns_posix_paths(self, session_id: str, temp_workspace: Path) -> None:
         """Returned paths use forward slashes on all platforms."""
         workspace = temp_workspace / session_id
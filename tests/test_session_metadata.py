@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import time
+from dataclasses import asdict
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -16,6 +17,7 @@ from sandbox import (
     create_sandbox,
 )
 from sandbox.core.logging import SandboxLogger
+from sandbox.core.storage import DiskStorageAdapter
 from sandbox.sessions import (
     SessionMetadata,
     _read_session_metadata,
@@ -59,6 +61,18 @@ def test_session_metadata_to_dict() -> None:
     assert data["version"] == 1
 
 
+def test_session_metadata_to_dict_covers_all_fields() -> None:
+    """Test hand-written to_dict stays in sync with the dataclass fields."""
+    metadata = SessionMetadata(
+        session_id="abc-123",
+        created_at="2025-11-22T10:00:00Z",
+        updated_at="2025-11-22T14:00:00Z",
+        version=1,
+    )
+
+    assert metadata.to_dict() == asdict(metadata)
+
+
 def test_session_metadata_from_dict() -> None:
     """Test SessionMetadata deserialization from dict."""
     data = {
@@ -104,6 +118,33 @@ def test_create_session_writes_metadata(tmp_path: Path) -> None:
     assert metadata_path.is_file()
 
 
+def test_create_sandbox_skips_exists_probe_for_generated_id(tmp_path: Path, monkeypatch) -> None:
+    """Test that a generated session ID is created without a session_exists() call."""
+
+    def fail_probe(self, session_id):
+        raise AssertionError("session_exists() called for a freshly generated session ID")
+
+    monkeypatch.setattr(DiskStorageAdapter, "session_exists", fail_probe)
+
+    sandbox = create_sandbox(runtime=RuntimeType.PYTHON, workspace_root=tmp_path)
+
+    assert (tmp_path / sandbox.session_id / ".metadata.json").is_file()
+
+
+def test_create_sandbox_accepts_adapter_with_base_signature(tmp_path: Path) -> None:
+    """Test that an adapter implementing create_session(session_id) still works."""
+    calls = []
+
+    class CustomAdapter(DiskStorageAdapter):
+        def create_session(self, session_id):
+            calls.append(session_id)
+            super().create_session(session_id)
+
+    sandbox = create_sandbox(runtime=RuntimeType.PYTHON, storage_adapter=CustomAdapter(tmp_path))
+
+    assert calls == [sandbox.session_id]
+
+
 def test_metadata_json_format(tmp_path: Path) -> None:
     """Test that .metadata.json contains valid JSON with expected fields."""
     sandbox = create_sandbox(runtime=RuntimeType.PYTHON, workspace_root=tmp_path)
@@ -268,6 +309,20 @@ def test_update_session_timestamp(tmp_path: Path) -> None:
     assert updated_data["version"] == initial_data["version"]
 
 
+def test_update_session_timestamp_keeps_non_ascii_metadata_as_utf8(tmp_path: Path) -> None:
+    """Test that rewritten metadata is UTF-8 on disk, whatever the locale."""
+    sandbox = create_sandbox(runtime=RuntimeType.PYTHON, workspace_root=tmp_path)
+    session_id = sandbox.session_id
+    metadata_path = tmp_path / session_id / ".metadata.json"
+    data = json.loads(metadata_path.read_text(encoding="utf-8"))
+    data["label"] = "café ✓"
+    metadata_path.write_text(json.dumps(data), encoding="utf-8")
+
+    _update_session_timestamp(session_id, tmp_path)
+
+    assert json.loads(metadata_path.read_bytes().decode("utf-8"))["label"] == "café ✓"
+
+
 def test_update_session_timestamp_legacy_session(tmp_path: Path) -> None:
     """Test _update_session_timestamp skips sessions without metadata."""
     # Create session workspace without metadata
@@ -7,6 +7,7 @@ dry-run mode, error handling, and security boundaries.
 from __future__ import annotations
 
 import json
+import os
 import shutil
 import time
 import uuid
@@ -16,10 +17,20 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from sandbox import sessions
+from sandbox.core import storage
 from sandbox.core.logging import SandboxLogger
 from sandbox.sessions import SessionMetadata, prune_sessions
 
 
+@pytest.fixture(autouse=True)
+def _clear_metadata_cache():
+    """Start and end every test with an empty parsed-metadata cache."""
+    storage._METADATA_CACHE.clear()
+    yield
+    storage._METADATA_CACHE.clear()
+
+
 def _create_dummy_session(
     workspace_root: Path, session_id: str, age_hours: float, size_bytes: int = 1024
 ) -> None:
@@ -356,3 +367,31 @@ def test_prune_corrupted_timestamp_logging(tmp_path: Path) -> None:
     args = logger.log_prune_skipped.call_args[1]
     assert args["session_id"] == session_id
     assert "corrupted_timestamp" in args["reason"]
+
+
+def test_prune_reuses_parsed_metadata_until_file_changes(tmp_path: Path) -> None:
+    """Unchanged metadata is served from the stat-keyed cache on repeat scans."""
+    session_id = str(uuid.uuid4())
+    _create_dummy_session(tmp_path, session_id, age_hours=1.0)
+    metadata_path = tmp_path / session_id / ".metadata.json"
+
+    # Age the file past the racy-write window so it becomes cacheable
+    old_mtime = time.time() - 60
+    os.utime(metadata_path, (old_mtime, old_mtime))
+
+    with patch("sandbox.sessions._load_metadata", wraps=sessions._load_metadata) as load:
+        prune_sessions(older_than_hours=24.0, workspace_root=tmp_path)
+        assert load.call_count == 1
+
+        # The second scan of the unchanged file must not parse it again
+        prune_sessions(older_than_hours=24.0, workspace_root=tmp_path)
+        assert load.call_count == 1
+
+        # Rewriting the file changes the key, so the new contents are picked up
+        _create_dummy_session(tmp_path, session_id, age_hours=25.0)
+        os.utime(metadata_path, (old_mtime + 1, old_mtime + 1))
+
+        result = prune_sessions(older_than_hours=24.0, workspace_root=tmp_path)
+
+    assert load.call_count == 2
+    assert session_id in result.deleted_sessions